@@ -23,11 +23,14 @@ def _setup():
     if str(_SRC) not in sys.path:
         sys.path.insert(0, str(_SRC))
 
+    # Everything the UI cells need is imported once here, not per reactive run
+    from vault.canvas import build_canvas_html
     from vault.db import VaultDB
+    from vault.graph import build_graph_spec
     from vault.index import VaultIndex
     from vault.plugin import fire_hook, load_all_plugins
     from vault.skills import SkillIndex
-    from vault.todos import scan_todos
+    from vault.todos import append_todo, scan_todos
 
     _index = VaultIndex(_VAULT_DIR)
     _index.build()
@@ -48,6 +51,9 @@ def _setup():
         _todo_index,
         _vault_db,
         _VAULT_DIR,
+        append_todo,
+        build_canvas_html,
+        build_graph_spec,
         fire_hook,
     )
 
@@ -61,7 +67,9 @@ def _setup():
 def _state(mo):
     selected_slug = mo.state("")
     active_tab = mo.state("graph")
-    return active_tab, selected_slug
+    # Number of sidebar links rendered; grown a page at a time by "Show more"
+    sidebar_limit = mo.state(200)
+    return active_tab, selected_slug, sidebar_limit
 
 
 # ---------------------------------------------------------------------------
@@ -70,21 +78,21 @@ def _state(mo):
 
 
 @app.cell
-def _quick_capture(mo, _VAULT_DIR, selected_slug):
+def _quick_capture(mo, _VAULT_DIR, append_todo, selected_slug):
     """Typing 'tk <description>' in the command bar appends a todo to todos.md."""
-    from vault.todos import append_todo
-
     cmd_input = mo.ui.text(
         placeholder="tk <description>  —  quick-capture a TK todo",
         label="",
         full_width=True,
+        debounce=150,
     )
 
     last_captured = mo.state("")
     set_last_captured = last_captured[1]
 
     raw = cmd_input.value.strip()
-    if raw.lower().startswith("tk ") and len(raw) > 3:
+    # Lower-cases only the prefix rather than the whole input on every run
+    if raw[:3].lower() == "tk " and len(raw) > 3:
         desc = raw[3:].strip()
         source = selected_slug[0]
         append_todo(_VAULT_DIR, desc, source_slug=source)
@@ -116,25 +124,29 @@ def _quick_capture(mo, _VAULT_DIR, selected_slug):
 
 
 @app.cell
-def _sidebar(mo, _index, active_tab, selected_slug):
+def _sidebar(mo, _index, active_tab, selected_slug, sidebar_limit):
     set_slug = selected_slug[1]
     set_tab = active_tab[1]
+    get_limit, set_limit = sidebar_limit
+    limit = get_limit()
 
-    search_input = mo.ui.text(placeholder="Search notes…", label="", full_width=True)
-    tag_options = sorted(_index.tags.keys())
-    tag_filter = mo.ui.dropdown(options=["(all)"] + tag_options, value="(all)", label="Tag")
+    search_input = mo.ui.text(
+        placeholder="Search notes…", label="", full_width=True, debounce=150
+    )
+    tag_filter = mo.ui.dropdown(
+        options=["(all)", *_index.tag_options_sorted], value="(all)", label="Tag"
+    )
 
     query = search_input.value.strip()
     tag = tag_filter.value
 
+    # All three sources are already ordered by title
     if query:
         results = _index.search(query)
     elif tag and tag != "(all)":
         results = _index.notes_with_tag(tag)
     else:
-        results = list(_index.notes.values())
-
-    results = sorted(results, key=lambda n: n.title)
+        results = _index.notes_sorted
 
     def _make_link(note):
         return mo.ui.button(
@@ -144,13 +156,25 @@ def _sidebar(mo, _index, active_tab, selected_slug):
             full_width=True,
         )
 
+    # Only the first `limit` results get a button; large vaults page in on demand
+    links = [_make_link(n) for n in results[:limit]]
+    if len(results) > limit:
+        links.append(
+            mo.ui.button(
+                label=f"Show more ({len(results) - limit} hidden)",
+                on_click=lambda _: set_limit(lambda n: n + 200),
+                kind="neutral",
+                full_width=True,
+            )
+        )
+
     sidebar = mo.vstack(
         [
             mo.md("## Notes"),
             search_input,
             tag_filter,
             mo.divider(),
-            *[_make_link(n) for n in results],
+            *links,
         ],
         gap="4px",
     )
@@ -163,9 +187,7 @@ def _sidebar(mo, _index, active_tab, selected_slug):
 
 
 @app.cell
-def _graph_tab(mo, _index, selected_slug):
-    from vault.graph import build_graph_spec
-
+def _graph_tab(mo, _index, build_graph_spec, selected_slug):
     chart = build_graph_spec(
         _index, highlight=selected_slug[0] or None, width=900, height=560
     )
@@ -179,9 +201,7 @@ def _graph_tab(mo, _index, selected_slug):
 
 
 @app.cell
-def _canvas_tab(mo, _index):
-    from vault.canvas import build_canvas_html
-
+def _canvas_tab(mo, _index, build_canvas_html):
     canvas_panel = mo.Html(build_canvas_html(_index, width="100%", height="620px"))
     return (canvas_panel,)
 
@@ -193,10 +213,6 @@ def _canvas_tab(mo, _index):
 
 @app.cell
 def _editor_tab(mo, _index, _todo_index, selected_slug):
-    import re
-
-    from vault.backlinks import backlinks_panel_ui
-
     slug = selected_slug[0]
     note = _index.notes.get(slug) if slug else None
 
@@ -207,29 +223,19 @@ def _editor_tab(mo, _index, _todo_index, selected_slug):
         backlinks_content = mo.md("")
         note_todos_content = mo.md("")
     else:
-        body_rendered = re.sub(r"\[\[([^\]|]+)\]\]", r"**\1**", note.body)
-        tags_md = " ".join(f"`#{t}`" for t in note.tags)
-
         editor_content = mo.vstack(
             [
                 mo.md(f"# {note.title}"),
-                mo.md(tags_md) if note.tags else mo.md(""),
+                mo.md(note.tags_md) if note.tags else mo.md(""),
                 mo.divider(),
-                mo.md(body_rendered),
+                mo.md(note.body_rendered),
             ]
         )
 
-        bl = backlinks_panel_ui(_index, slug)
+        bl_md = _index.backlinks_md.get(slug)
         backlinks_content = (
-            mo.vstack(
-                [
-                    mo.md("---\n### Backlinks"),
-                    mo.md(
-                        "\n".join(f"- **{b['title']}** (`{b['slug']}`)" for b in bl)
-                    ),
-                ]
-            )
-            if bl
+            mo.vstack([mo.md("---\n### Backlinks"), mo.md(bl_md)])
+            if bl_md
             else mo.md("_No backlinks._")
         )
 
@@ -266,22 +272,22 @@ def _todos_tab(mo, _todo_index, active_tab, selected_slug):
             mo.md("No pending TK items — vault is clean ✓"), kind="success"
         )
     else:
-        rows = []
-        for item in pending:
-            note_btn = mo.ui.button(
-                label=item.source_slug,
-                on_click=lambda _, s=item.source_slug: (set_slug(s), set_tab("editor")),
-                kind="ghost",
-            )
-            rows.append(
-                mo.hstack(
-                    [note_btn, mo.md(f"**{item.description}** _(line {item.line_no})_")],
-                    gap="8px",
-                    align="center",
-                )
-            )
+        def _open_selected(selection):
+            # Selecting a row jumps to its source note in the editor
+            if selection:
+                set_slug(selection[0]["note"])
+                set_tab("editor")
+
+        todos_table = mo.ui.table(
+            [
+                {"note": t.source_slug, "description": t.description, "line": t.line_no}
+                for t in pending
+            ],
+            selection="single",
+            on_change=_open_selected,
+        )
         todos_panel = mo.vstack(
-            [mo.md(f"### {len(pending)} pending TK items"), *rows], gap="4px"
+            [mo.md(f"### {len(pending)} pending TK items"), todos_table], gap="4px"
         )
     return (todos_panel,)
 
@@ -293,7 +299,9 @@ def _todos_tab(mo, _todo_index, active_tab, selected_slug):
 
 @app.cell
 def _skills_tab(mo, _skill_index):
-    skill_search = mo.ui.text(placeholder="Search skills…", label="", full_width=True)
+    skill_search = mo.ui.text(
+        placeholder="Search skills…", label="", full_width=True, debounce=150
+    )
     selected_skill = mo.state(None)
     set_selected_skill = selected_skill[1]
 
@@ -319,7 +327,7 @@ def _skills_tab(mo, _skill_index):
                 mo.md(f"## {current.name}"),
                 mo.md(f"**Triggers:** {triggers_md}  ·  **Tags:** {tags_md}"),
                 mo.divider(),
-                mo.md(current.body),
+                mo.md(current.read_body()),
             ]
         )
     else:
@@ -347,10 +355,9 @@ def _skills_tab(mo, _skill_index):
 
 
 @app.cell
-def _database_tab(mo, _vault_db, _index):
-    # Controls
-    db_search = mo.ui.text(placeholder="Filter title/body…", label="Search")
-    tag_opts = ["(all)"] + sorted(_index.tags.keys())
+def _database_controls(mo, _vault_db, _index):
+    db_search = mo.ui.text(placeholder="Filter title/body…", label="Search", debounce=150)
+    tag_opts = ["(all)", *_index.tag_options_sorted]
     db_tag = mo.ui.dropdown(options=tag_opts, value="(all)", label="Tag")
     fm_keys = _vault_db.frontmatter_keys()
     kanban_key = mo.ui.dropdown(
@@ -363,14 +370,24 @@ def _database_tab(mo, _vault_db, _index):
         rows=3,
     )
     run_btn = mo.ui.button(label="Run SQL", kind="neutral")
+    return db_search, db_tag, kanban_key, run_btn, sql_input
+
+
+# Each view below is its own cell so marimo reruns only the one whose
+# controls changed (typing in the search box leaves kanban and SQL alone).
 
-    # Table view
+
+@app.cell
+def _table_view(mo, _vault_db, db_search, db_tag):
     tag_filter = db_tag.value if db_tag.value != "(all)" else None
     search_val = db_search.value.strip() or None
     table_df = _vault_db.table_view(filter_tag=tag_filter, search=search_val)
     table_view = mo.ui.table(table_df)
+    return (table_view,)
+
 
-    # Kanban view
+@app.cell
+def _kanban_tab(mo, _vault_db, kanban_key):
     if kanban_key.value and kanban_key.value != "(none)":
         groups = _vault_db.kanban_view(group_by=kanban_key.value)
         cols = []
@@ -393,11 +410,11 @@ def _database_tab(mo, _vault_db, _index):
         kanban_view = mo.hstack(cols, gap="8px", align="start") if cols else mo.md("_No groups._")
     else:
         kanban_view = mo.md("_Choose a frontmatter key above._")
+    return (kanban_view,)
 
-    # Tag stats
-    tag_stats = mo.ui.table(_vault_db.tag_counts())
 
-    # SQL console
+@app.cell
+def _sql_console(mo, _vault_db, sql_input, run_btn):
     if run_btn.value:
         try:
             result_df = _vault_db.query(sql_input.value)
@@ -406,7 +423,22 @@ def _database_tab(mo, _vault_db, _index):
             sql_output = mo.callout(mo.md(f"```\n{exc}\n```"), kind="danger")
     else:
         sql_output = mo.md("_Press **Run SQL** to execute._")
+    return (sql_output,)
 
+
+@app.cell
+def _database_tab(
+    mo,
+    _vault_db,
+    db_search,
+    db_tag,
+    kanban_key,
+    sql_input,
+    run_btn,
+    table_view,
+    kanban_view,
+    sql_output,
+):
     database_panel = mo.vstack(
         [
             mo.md("## Database  _(VaultDB / Bases)_"),
@@ -415,7 +447,7 @@ def _database_tab(mo, _vault_db, _index):
                 {
                     "Table view": table_view,
                     "Kanban view": kanban_view,
-                    "Tag statistics": tag_stats,
+                    "Tag statistics": mo.ui.table(_vault_db.tag_counts()),
                     "SQL console": mo.vstack([sql_input, run_btn, sql_output]),
                 }
             ),
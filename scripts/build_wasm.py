@@ -172,11 +172,14 @@ def _setup(_wasm_init):
     """Bootstrap vault index, plugins, and sub-systems (WASM-adapted)."""
     _wasm_vault_dir, _wasm_skills_dir, _wasm_plugins_dir = _wasm_init
 
+    # Everything the UI cells need is imported once here, not per reactive run
+    from vault.canvas import build_canvas_html
     from vault.db import VaultDB
+    from vault.graph import build_graph_spec
     from vault.index import VaultIndex
     from vault.plugin import fire_hook, load_all_plugins
     from vault.skills import SkillIndex
-    from vault.todos import scan_todos
+    from vault.todos import append_todo, scan_todos
 
     _index = VaultIndex(_wasm_vault_dir)
     _index.build()
@@ -199,6 +202,9 @@ def _setup(_wasm_init):
         _todo_index,
         _vault_db,
         _VAULT_DIR,
+        append_todo,
+        build_canvas_html,
+        build_graph_spec,
         fire_hook,
     )
 
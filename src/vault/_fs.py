@@ -0,0 +1,32 @@
+"""Filesystem helpers shared by the vault and skill indexes."""
+
+from __future__ import annotations
+
+import os
+
+
+def walk_markdown(root: str) -> list[tuple[str, tuple[int, int]]]:
+    """Return ``(path, (mtime_ns, size))`` for every ``*.md`` file below *root*.
+
+    Uses an explicit stack of :func:`os.scandir` iterators so the file-type
+    checks come from the cached ``DirEntry`` metadata instead of a fresh
+    ``stat`` per entry.  Directory symlinks are not followed.  Results are
+    ordered like ``sorted(Path.glob("**/*.md"))``.
+    """
+    found: list[tuple[str, tuple[int, int]]] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        st = entry.stat()
+                        found.append((entry.path, (st.st_mtime_ns, st.st_size)))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+    # Compare path components (not raw strings) to match Path ordering
+    found.sort(key=lambda item: item[0].split(os.sep))
+    return found
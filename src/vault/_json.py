@@ -0,0 +1,20 @@
+"""Compact JSON encoding and decoding shared by the vault modules."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def dumps(obj: Any) -> str:
+    """Serialise *obj* to a compact JSON string.
+
+    Values JSON has no type for (dates from YAML frontmatter, paths) are
+    written as their ``str()``.
+    """
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from *data*."""
+    return json.loads(data)
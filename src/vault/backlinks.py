@@ -13,13 +13,11 @@ if TYPE_CHECKING:
 
 
 def backlinks_panel_ui(index: "VaultIndex", slug: str) -> list[dict[str, str]]:
-    """Return a list of ``{slug, title}`` dicts for notes that link to *slug*."""
-    sources = index.backlinks.get(slug, [])
-    return [
-        {"slug": s, "title": index.notes[s].title}
-        for s in sources
-        if s in index.notes
-    ]
+    """Return a list of ``{slug, title}`` dicts for notes that link to *slug*.
+
+    The rows are precomputed by :meth:`VaultIndex.build`; treat them as read-only.
+    """
+    return index.backlinks_rendered.get(slug, [])
 
 
 class _BacklinksPlugin:
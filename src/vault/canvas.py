@@ -20,11 +20,12 @@ helpers so the sync layer (:mod:`vault.sync`) can persist snapshots.
 
 from __future__ import annotations
 
-import json
 import math
-import uuid
+import weakref
 from typing import TYPE_CHECKING, Any
 
+from vault import _json
+
 if TYPE_CHECKING:
     from vault.index import VaultIndex
     from vault.plugin import PluginDescriptor
@@ -42,20 +43,51 @@ _CARD_H = 140
 _COL_SPACING = 300
 _ROW_SPACING = 200
 
+# Fixed shape props, merged into each record (only scalar values, so the
+# shallow copy never shares mutable state between shapes)
+_CARD_PROPS: dict[str, Any] = {
+    "geo": "rectangle",
+    "w": _CARD_W,
+    "h": _CARD_H,
+    "richText": None,
+    "font": "sans",
+    "align": "start",
+    "verticalAlign": "start",
+    "size": "s",
+    "color": "violet",
+    "fill": "semi",
+    "dash": "draw",
+    "labelColor": "black",
+}
+_ARROW_PROPS: dict[str, Any] = {
+    "dash": "draw",
+    "size": "s",
+    "fill": "none",
+    "color": "grey",
+    "labelColor": "black",
+    "bend": 0,
+    "arrowheadStart": "none",
+    "arrowheadEnd": "arrow",
+    "text": "",
+}
+
+
+def _shape_ids(start: int, stop: int) -> tuple[list[str], list[str]]:
+    """Return ``(ids, fractional indexes)`` for shapes numbered *start*..*stop*.
+
+    Ids only need to be unique within one snapshot, so they are sequential.
+    """
+    ids = [f"shape:{i:012x}" for i in range(start, stop)]
+    return ids, [f"a{shape_id[-4:]}" for shape_id in ids]
 
-def _make_id() -> str:
-    return f"shape:{uuid.uuid4().hex[:12]}"
 
+def _grid_positions(n: int) -> tuple[list[int], list[int]]:
+    """Return x and y coordinates arranging *n* note cards in a square grid."""
+    import numpy as np
 
-def _position_notes(slugs: list[str]) -> dict[str, tuple[float, float]]:
-    """Arrange note cards in a simple grid (columns of 4)."""
-    cols = max(1, math.ceil(math.sqrt(len(slugs))))
-    positions: dict[str, tuple[float, float]] = {}
-    for i, slug in enumerate(slugs):
-        col = i % cols
-        row = i // cols
-        positions[slug] = (col * _COL_SPACING, row * _ROW_SPACING)
-    return positions
+    cols = max(1, math.ceil(math.sqrt(n)))
+    rows, col_idx = np.divmod(np.arange(n), cols)
+    return (col_idx * _COL_SPACING).tolist(), (rows * _ROW_SPACING).tolist()
 
 
 def build_tldraw_snapshot(index: "VaultIndex") -> dict[str, Any]:
@@ -64,108 +96,90 @@ def build_tldraw_snapshot(index: "VaultIndex") -> dict[str, Any]:
     Returns a dict that matches the TLDraw ``StoreSnapshot`` shape and can be
     passed directly to the ``initialState`` prop in the HTML template.
     """
+    # Ids, fractional indexes and coordinates are computed in bulk up front;
+    # the loops below only assemble records
     slugs = list(index.notes.keys())
-    positions = _position_notes(slugs)
+    xs, ys = _grid_positions(len(slugs))
+    shape_ids, shape_indexes = _shape_ids(0, len(slugs))
+    slug_to_id: dict[str, str] = dict(zip(slugs, shape_ids, strict=True))
 
-    slug_to_id: dict[str, str] = {slug: _make_id() for slug in slugs}
-
-    records: list[dict[str, Any]] = []
+    store: dict[str, dict[str, Any]] = {}
 
     # Page
     page_id = "page:main"
-    records.append(
-        {
-            "typeName": "page",
-            "id": page_id,
-            "name": "Vault",
-            "index": "a1",
-            "meta": {},
-        }
-    )
+    store[page_id] = {
+        "typeName": "page",
+        "id": page_id,
+        "name": "Vault",
+        "index": "a1",
+        "meta": {},
+    }
 
     # Note cards (geo shapes with text)
-    for slug, note in index.notes.items():
-        x, y = positions[slug]
-        shape_id = slug_to_id[slug]
-        records.append(
-            {
-                "typeName": "shape",
-                "id": shape_id,
-                "type": "geo",
-                "parentId": page_id,
-                "index": f"a{slug_to_id[slug][-4:]}",
-                "x": x,
-                "y": y,
-                "rotation": 0,
-                "isLocked": False,
-                "opacity": 1,
-                "meta": {"slug": slug},
-                "props": {
-                    "geo": "rectangle",
-                    "w": _CARD_W,
-                    "h": _CARD_H,
-                    "text": f"**{note.title}**\n\n{', '.join(f'#{t}' for t in note.tags[:3])}",
-                    "richText": None,
-                    "font": "sans",
-                    "align": "start",
-                    "verticalAlign": "start",
-                    "size": "s",
-                    "color": "violet",
-                    "fill": "semi",
-                    "dash": "draw",
-                    "labelColor": "black",
-                },
-            }
-        )
+    for note, shape_id, shape_index, x, y in zip(
+        index.notes.values(), shape_ids, shape_indexes, xs, ys, strict=True
+    ):
+        store[shape_id] = {
+            "typeName": "shape",
+            "id": shape_id,
+            "type": "geo",
+            "parentId": page_id,
+            "index": shape_index,
+            "x": x,
+            "y": y,
+            "rotation": 0,
+            "isLocked": False,
+            "opacity": 1,
+            "meta": {"slug": note.slug},
+            "props": {
+                **_CARD_PROPS,
+                "text": f"**{note.title}**\n\n{', '.join(f'#{t}' for t in note.tags[:3])}",
+            },
+        }
 
-    # Arrows for each link
-    for src_slug, tgt_slug in index.edges():
-        if src_slug not in slug_to_id or tgt_slug not in slug_to_id:
-            continue
-        arrow_id = _make_id()
-        records.append(
-            {
-                "typeName": "shape",
-                "id": arrow_id,
-                "type": "arrow",
-                "parentId": page_id,
-                "index": f"a{arrow_id[-4:]}",
-                "x": 0,
-                "y": 0,
-                "rotation": 0,
-                "isLocked": False,
-                "opacity": 0.7,
-                "meta": {},
-                "props": {
-                    "dash": "draw",
-                    "size": "s",
-                    "fill": "none",
-                    "color": "grey",
-                    "labelColor": "black",
-                    "bend": 0,
-                    "start": {
-                        "type": "binding",
-                        "boundShapeId": slug_to_id[src_slug],
-                        "normalizedAnchor": {"x": 0.5, "y": 1.0},
-                        "isExact": False,
-                        "isPrecise": False,
-                    },
-                    "end": {
-                        "type": "binding",
-                        "boundShapeId": slug_to_id[tgt_slug],
-                        "normalizedAnchor": {"x": 0.5, "y": 0.0},
-                        "isExact": False,
-                        "isPrecise": False,
-                    },
-                    "arrowheadStart": "none",
-                    "arrowheadEnd": "arrow",
-                    "text": "",
+    # Arrows for each link between two known notes
+    links = [
+        (slug_to_id[src], slug_to_id[tgt])
+        for src, tgt in index.iter_edges()
+        if src in slug_to_id and tgt in slug_to_id
+    ]
+    arrow_ids, arrow_indexes = _shape_ids(len(slugs), len(slugs) + len(links))
+    for (src_id, tgt_id), arrow_id, arrow_index in zip(
+        links, arrow_ids, arrow_indexes, strict=True
+    ):
+        store[arrow_id] = {
+            "typeName": "shape",
+            "id": arrow_id,
+            "type": "arrow",
+            "parentId": page_id,
+            "index": arrow_index,
+            "x": 0,
+            "y": 0,
+            "rotation": 0,
+            "isLocked": False,
+            "opacity": 0.7,
+            "meta": {},
+            "props": {
+                **_ARROW_PROPS,
+                "start": {
+                    "type": "binding",
+                    "boundShapeId": src_id,
+                    "normalizedAnchor": {"x": 0.5, "y": 1.0},
+                    "isExact": False,
+                    "isPrecise": False,
                 },
-            }
-        )
+                "end": {
+                    "type": "binding",
+                    "boundShapeId": tgt_id,
+                    "normalizedAnchor": {"x": 0.5, "y": 0.0},
+                    "isExact": False,
+                    "isPrecise": False,
+                },
+            },
+        }
 
     return {
-        "store": {r["id"]: r for r in records},
+        "store": store,
         "schema": {"schemaVersion": 2, "sequences": {}},
     }
 
@@ -254,22 +268,64 @@ def build_canvas_html(
         *snapshot* is supplied.
     snapshot:
         An existing TLDraw store snapshot (e.g. loaded from the sync backend).
-        If ``None``, a fresh layout is computed from *index*.
+        If ``None``, a fresh layout is computed from *index* and the HTML is
+        cached until the index version changes.
     width / height:
         Dimensions of the containing ``<iframe>`` element (CSS strings).
     """
-    doc = snapshot if snapshot is not None else build_tldraw_snapshot(index)
-    html = _HTML_TEMPLATE.format(
+    if snapshot is None:
+        return _index_canvas_html(index, width, height)
+    return _render_canvas_html(snapshot, width, height)
+
+
+# index → {(version, width, height): html}; weak, so cached HTML never keeps
+# a discarded index alive
+_INDEX_HTML: "weakref.WeakKeyDictionary[VaultIndex, dict[tuple[int, str, str], str]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Pages kept per index, oldest dropped first
+_INDEX_HTML_PER_INDEX = 4
+
+
+def _index_canvas_html(index: "VaultIndex", width: str, height: str) -> str:
+    """Fresh-layout canvas, memoised per index version and size."""
+    pages = _INDEX_HTML.setdefault(index, {})
+    key = (index.version, width, height)
+    html = pages.get(key)
+    if html is None:
+        html = pages[key] = _render_canvas_html(build_tldraw_snapshot(index), width, height)
+        if len(pages) > _INDEX_HTML_PER_INDEX:
+            del pages[next(iter(pages))]
+    return html
+
+
+def _srcdoc_escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace('"', "&quot;")
+
+
+# The template is constant apart from the snapshot, so its srcdoc-escaped
+# halves are computed once and only the JSON is escaped per render
+_SRCDOC_HEAD, _SRCDOC_TAIL = (
+    _srcdoc_escape(part)
+    for part in _HTML_TEMPLATE.format(
         react_version=_REACT_VERSION,
         tldraw_version=_TLDRAW_VERSION,
-        snapshot_json=json.dumps(doc),
-    )
+        snapshot_json="\0",
+    ).split("\0")
+)
+
+
+def _render_canvas_html(doc: dict[str, Any], width: str, height: str) -> str:
     # Wrap in an iframe using srcdoc so Marimo can embed it directly
-    escaped = html.replace("&", "&amp;").replace('"', "&quot;")
-    return (
-        f'<iframe srcdoc="{escaped}" '
-        f'style="border:none;width:{width};height:{height};border-radius:8px;" '
-        f'sandbox="allow-scripts allow-same-origin"></iframe>'
+    return "".join(
+        (
+            '<iframe srcdoc="',
+            _SRCDOC_HEAD,
+            _srcdoc_escape(_json.dumps(doc)),
+            _SRCDOC_TAIL,
+            f'" style="border:none;width:{width};height:{height};border-radius:8px;" ',
+            'sandbox="allow-scripts allow-same-origin"></iframe>',
+        )
     )
 
 
@@ -293,6 +349,8 @@ class _CanvasPlugin:
         self.descriptor = descriptor
         self._index: "VaultIndex | None" = None
         self._snapshot: dict[str, Any] | None = None
+        # (index version, HTML) of the last render without an override snapshot
+        self._html_cache: tuple[int, str] | None = None
 
     def on_load(self, index: "VaultIndex") -> None:
         self._index = index
@@ -300,6 +358,7 @@ class _CanvasPlugin:
     def on_index_update(self, index: "VaultIndex") -> None:
         self._index = index
         self._snapshot = None  # invalidate cached snapshot
+        self._html_cache = None
 
     def on_note_select(self, slug: str, index: "VaultIndex") -> None:
         self._index = index
@@ -307,7 +366,13 @@ class _CanvasPlugin:
     def render(self, snapshot: dict[str, Any] | None = None) -> str:
         if self._index is None:
             raise RuntimeError("Plugin not loaded — call on_load first.")
-        return build_canvas_html(self._index, snapshot=snapshot or self._snapshot)
+        if snapshot is not None:
+            return build_canvas_html(self._index, snapshot=snapshot)
+        version = self._index.version
+        if self._html_cache is None or self._html_cache[0] != version:
+            html = build_canvas_html(self._index, snapshot=self._snapshot)
+            self._html_cache = (version, html)
+        return self._html_cache[1]
 
 
 def create_plugin(descriptor: "PluginDescriptor") -> "_CanvasPlugin":
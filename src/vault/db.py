@@ -21,15 +21,22 @@ Usage::
 
 from __future__ import annotations
 
-import json
+import re
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 import duckdb
 import polars as pl
 
+from vault import _json
+
 if TYPE_CHECKING:
     from vault.index import VaultIndex
 
+# table_view results kept per refresh (each is a full DataFrame, and free-text
+# search makes the key space unbounded)
+_VIEW_CACHE_SIZE = 32
+
 
 class VaultDB:
     """In-memory DuckDB database over vault note metadata and frontmatter."""
@@ -45,35 +52,64 @@ class VaultDB:
     def refresh(self, index: "VaultIndex") -> None:
         """(Re-)populate the database from *index* (call after index rebuild)."""
         self._index = index
-        self._create_schema()
+        #: (filter_tag, search, columns, order_by) → result of :meth:`table_view`
+        self._view_cache: OrderedDict[tuple[Any, ...], pl.DataFrame] = OrderedDict()
+        # Introspection results, computed on first use after each refresh
+        self._frontmatter_keys: list[str] | None = None
+        self._tag_counts: pl.DataFrame | None = None
+        self._build_frame()
         self._load_notes()
 
-    def _create_schema(self) -> None:
-        self.conn.execute("""
-            CREATE OR REPLACE TABLE notes (
-                slug        VARCHAR PRIMARY KEY,
-                title       VARCHAR,
-                body        TEXT,
-                tags        VARCHAR[],
-                links       VARCHAR[],
-                frontmatter JSON
-            )
-        """)
+    def _build_frame(self) -> None:
+        # Columnar copy of the note table, built one column at a time; it
+        # feeds the DuckDB table and lets table_view filter without SQL
+        notes = list(self._index.notes.values())
+        self._frame = pl.DataFrame(
+            {
+                "slug": [n.slug for n in notes],
+                # YAML may yield numbers (``title: 1984``, ``tags: [2024]``);
+                # the columns are text, so convert rather than reject them
+                "title": [str(n.title) for n in notes],
+                "body": [n.body for n in notes],
+                "tags": [list(map(str, n.tags)) for n in notes],
+                "links": [n.links for n in notes],
+                "frontmatter": [_json.dumps(n.frontmatter) for n in notes],
+            },
+            schema={
+                "slug": pl.String,
+                "title": pl.String,
+                "body": pl.String,
+                "tags": pl.List(pl.String),
+                "links": pl.List(pl.String),
+                "frontmatter": pl.String,
+            },
+        )
 
     def _load_notes(self) -> None:
-        rows = [
-            (
-                note.slug,
-                note.title,
-                note.body,
-                note.tags,
-                note.links,
-                json.dumps(note.frontmatter),
-            )
-            for note in self._index.notes.values()
-        ]
-        if rows:
-            self.conn.executemany("INSERT OR REPLACE INTO notes VALUES (?,?,?,?,?,?)", rows)
+        # One Arrow scan builds the whole table; no per-row Python→DuckDB
+        # round-trips and no primary-key index to maintain (slugs are unique
+        # by construction in VaultIndex.notes)
+        self.conn.register("_notes_frame", self._frame)
+        try:
+            self.conn.execute("""
+                CREATE OR REPLACE TABLE notes AS
+                SELECT
+                    slug,
+                    title,
+                    body,
+                    tags,
+                    links,
+                    CAST(frontmatter AS JSON) AS frontmatter,
+                    -- Same properties as a native map, decoded once here so
+                    -- lookups by key never re-parse the JSON text.  Values
+                    -- match json_extract_string: strings unquoted, anything
+                    -- else as JSON text, JSON null as NULL.
+                    CAST(CAST(frontmatter AS JSON) AS MAP(VARCHAR, VARCHAR))
+                        AS frontmatter_map
+                FROM _notes_frame
+            """)
+        finally:
+            self.conn.unregister("_notes_frame")
 
     # ------------------------------------------------------------------
     # Query
@@ -107,21 +143,63 @@ class VaultDB:
             Which columns to include.  Defaults to ``slug, title, tags, links``.
         order_by:
             Column name to sort by.
-        """
-        cols = ", ".join(columns) if columns else "slug, title, tags, links"
-        where_clauses: list[str] = []
 
+        The most recent results are memoised per argument combination until
+        the next :meth:`refresh`, so toggling between filters does not re-query.
+        """
+        key = (filter_tag, search, tuple(columns) if columns else None, order_by)
+        cached = self._view_cache.get(key)
+        if cached is not None:
+            self._view_cache.move_to_end(key)
+            return cached
+
+        wanted = columns or ["slug", "title", "tags", "links"]
+        if order_by in self._frame.columns and all(c in self._frame.columns for c in wanted):
+            df = self._filter_frame(filter_tag, search).sort(order_by).select(wanted)
+        else:
+            df = self._table_view_sql(filter_tag, search, wanted, order_by)
+        self._view_cache[key] = df
+        if len(self._view_cache) > _VIEW_CACHE_SIZE:
+            self._view_cache.popitem(last=False)
+        return df
+
+    def _filter_frame(self, filter_tag: str | None, search: str | None) -> pl.DataFrame:
+        frame = self._frame
         if filter_tag:
-            safe = filter_tag.replace("'", "''")
-            where_clauses.append(f"'{safe}' = ANY(tags)")
+            frame = frame.filter(pl.col("tags").list.contains(filter_tag))
         if search:
-            safe = search.replace("'", "''")
-            where_clauses.append(f"(title ILIKE '%{safe}%' OR body ILIKE '%{safe}%')")
+            pattern = "(?i)" + re.escape(search)
+            frame = frame.filter(
+                pl.col("title").str.contains(pattern) | pl.col("body").str.contains(pattern)
+            )
+        return frame
 
-        where = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    def _table_view_sql(
+        self,
+        filter_tag: str | None,
+        search: str | None,
+        columns: list[str],
+        order_by: str,
+    ) -> pl.DataFrame:
+        # Sort keys the in-memory frame can't express (e.g. "title DESC").  User
+        # input is bound as parameters, so the SQL text — and DuckDB's plan —
+        # only varies with the column list and sort order.
+        unknown = [c for c in columns if c not in self._frame.columns]
+        if unknown:
+            raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+        like = None
+        if search:
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            like = f"%{escaped}%"
         safe_order = order_by.replace(";", "").replace("'", "")
-        sql = f"SELECT {cols} FROM notes {where} ORDER BY {safe_order}"
-        return self.conn.execute(sql).pl()
+        sql = f"""
+            SELECT {", ".join(columns)} FROM notes
+            WHERE ($1::VARCHAR IS NULL OR list_contains(tags, $1))
+              AND ($2::VARCHAR IS NULL
+                   OR title ILIKE $2 ESCAPE '\\' OR body ILIKE $2 ESCAPE '\\')
+            ORDER BY {safe_order}
+        """
+        return self.conn.execute(sql, [filter_tag or None, like]).pl()
 
     def kanban_view(self, group_by: str = "status") -> dict[str, list[dict[str, Any]]]:
         """Group notes by a frontmatter property for a kanban-style view.
@@ -136,18 +214,16 @@ class VaultDB:
         -------
         dict mapping group label → list of note dicts.
         """
-        safe_key = group_by.replace("'", "").replace(";", "")
+        # Key bound as a parameter: any key name is safe
         df = self.conn.execute(
-            f"""
+            """
             SELECT
                 slug, title, tags,
-                COALESCE(
-                    json_extract_string(frontmatter, '$.{safe_key}'),
-                    '(none)'
-                ) AS group_val
+                COALESCE(frontmatter_map[$1], '(none)') AS group_val
             FROM notes
             ORDER BY group_val, title
-            """
+            """,
+            [group_by],
         ).pl()
 
         groups: dict[str, list[dict[str, Any]]] = {}
@@ -175,21 +251,25 @@ class VaultDB:
 
     def frontmatter_keys(self) -> list[str]:
         """Return all frontmatter property names present across all notes."""
-        rows = self.conn.execute(
-            "SELECT DISTINCT unnest(json_keys(frontmatter)) AS k FROM notes ORDER BY k"
-        ).fetchall()
-        return [r[0] for r in rows]
+        if self._frontmatter_keys is None:
+            rows = self.conn.execute(
+                "SELECT DISTINCT unnest(json_keys(frontmatter)) AS k FROM notes ORDER BY k"
+            ).fetchall()
+            self._frontmatter_keys = [r[0] for r in rows]
+        return self._frontmatter_keys
 
     def tag_counts(self) -> pl.DataFrame:
         """Return a tag → count table sorted by frequency."""
-        return self.conn.execute(
-            """
-            SELECT tag, COUNT(*) AS note_count
-            FROM (SELECT unnest(tags) AS tag FROM notes)
-            GROUP BY tag
-            ORDER BY note_count DESC, tag
-            """
-        ).pl()
+        if self._tag_counts is None:
+            self._tag_counts = self.conn.execute(
+                """
+                SELECT tag, COUNT(*) AS note_count
+                FROM (SELECT unnest(tags) AS tag FROM notes)
+                GROUP BY tag
+                ORDER BY note_count DESC, tag
+                """
+            ).pl()
+        return self._tag_counts
 
     # ------------------------------------------------------------------
     # Lifecycle
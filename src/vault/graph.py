@@ -6,6 +6,7 @@ The resulting chart can be embedded directly in a Marimo cell.
 
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -19,6 +20,14 @@ if TYPE_CHECKING:
 # Graph spec builder
 # ---------------------------------------------------------------------------
 
+# index → {(version, width, height, seed): chart}; weak, so a cached chart
+# never keeps a discarded index alive
+_BASE_CHARTS: "weakref.WeakKeyDictionary[VaultIndex, dict[tuple[int, int, int, int], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Charts kept per index, oldest dropped first
+_BASE_CHARTS_PER_INDEX = 8
+
 
 def build_graph_spec(
     index: "VaultIndex",
@@ -41,55 +50,90 @@ def build_graph_spec(
     seed:
         Random seed passed to ``networkx.spring_layout`` for reproducible
         positioning.
+
+    The layout, data frames, and layers are cached per index version (for
+    as long as the index is alive); a change of *highlight* only swaps the
+    top-level ``highlighted`` parameter.
     """
     import altair as alt
+
+    charts = _BASE_CHARTS.setdefault(index, {})
+    key = (index.version, width, height, seed)
+    base = charts.get(key)
+    if base is None:
+        base = charts[key] = _base_chart(index, width, height, seed)
+        if len(charts) > _BASE_CHARTS_PER_INDEX:
+            del charts[next(iter(charts))]
+    chart = base.copy(deep=False)
+    # null when nothing is selected, so no slug (not even the empty
+    # placeholder's "") compares equal to it
+    chart.params = [alt.VariableParameter(name="highlighted", value=highlight or None)]
+    return chart
+
+
+def _base_chart(index: "VaultIndex", width: int, height: int, seed: int) -> "alt.LayerChart":
+    """Build the highlight-independent chart."""
+    import altair as alt
     import networkx as nx
     import polars as pl
 
     G: nx.DiGraph = nx.DiGraph()
     for slug in index.notes:
         G.add_node(slug, title=index.notes[slug].title)
-    for src, tgt in index.edges():
+    for src, tgt in index.iter_edges():
         if src in G and tgt in G:
             G.add_edge(src, tgt)
 
     # Compute layout
     pos: dict[str, tuple[float, float]] = nx.spring_layout(G, seed=seed, k=2.0)
 
-    nodes_df = pl.DataFrame(
-        [
+    # Columnar (one list per field) frames with explicit dtypes: no per-row
+    # dicts and no schema inference
+    node_schema = {
+        "slug": pl.String,
+        "title": pl.String,
+        "x": pl.Float64,
+        "y": pl.Float64,
+        "degree": pl.Int64,
+    }
+    slugs: list[str] = list(G.nodes())
+    if slugs:
+        nodes_df = pl.DataFrame(
             {
-                "slug": slug,
-                "title": index.notes[slug].title if slug in index.notes else slug,
-                "x": float(pos[slug][0]),
-                "y": float(pos[slug][1]),
-                "degree": int(G.degree(slug)),
-                "highlighted": slug == highlight,
-            }
-            for slug in G.nodes()
-        ]
-        or [{"slug": "", "title": "", "x": 0.0, "y": 0.0, "degree": 0, "highlighted": False}]
-    )
+                "slug": slugs,
+                "title": [index.notes[s].title if s in index.notes else s for s in slugs],
+                "x": [float(pos[s][0]) for s in slugs],
+                "y": [float(pos[s][1]) for s in slugs],
+                "degree": [G.degree(s) for s in slugs],
+            },
+            schema=node_schema,
+        )
+    else:
+        nodes_df = pl.DataFrame(
+            {"slug": [""], "title": [""], "x": [0.0], "y": [0.0], "degree": [0]},
+            schema=node_schema,
+        )
 
-    edges_rows: list[dict[str, Any]] = []
-    for src, tgt in G.edges():
-        if src in pos and tgt in pos:
-            edges_rows.append(
-                {
-                    "x": float(pos[src][0]),
-                    "y": float(pos[src][1]),
-                    "x2": float(pos[tgt][0]),
-                    "y2": float(pos[tgt][1]),
-                    "source": src,
-                    "target": tgt,
-                }
-            )
+    edge_pairs = [(src, tgt) for src, tgt in G.edges() if src in pos and tgt in pos]
+    has_edges = len(edge_pairs) > 0
     edges_df = pl.DataFrame(
-        edges_rows
-        if edges_rows
-        else [{"x": 0.0, "y": 0.0, "x2": 0.0, "y2": 0.0, "source": "", "target": ""}]
+        {
+            "x": [float(pos[src][0]) for src, _ in edge_pairs],
+            "y": [float(pos[src][1]) for src, _ in edge_pairs],
+            "x2": [float(pos[tgt][0]) for _, tgt in edge_pairs],
+            "y2": [float(pos[tgt][1]) for _, tgt in edge_pairs],
+            "source": [src for src, _ in edge_pairs],
+            "target": [tgt for _, tgt in edge_pairs],
+        },
+        schema={
+            "x": pl.Float64,
+            "y": pl.Float64,
+            "x2": pl.Float64,
+            "y2": pl.Float64,
+            "source": pl.String,
+            "target": pl.String,
+        },
     )
-    has_edges = len(edges_rows) > 0
 
     base_props = {
         "width": width,
@@ -117,6 +161,9 @@ def build_graph_spec(
             )
         )
 
+    # The selected note is resolved client-side against the "highlighted" param
+    is_highlighted = "datum.slug === highlighted"
+
     # Node layer
     node_layer = (
         alt.Chart(nodes_df)
@@ -126,7 +173,7 @@ def build_graph_spec(
             y=alt.Y("y:Q", axis=None),
             size=alt.Size("degree:Q", scale=alt.Scale(range=[80, 400]), legend=None),
             color=alt.condition(
-                alt.datum["highlighted"],
+                is_highlighted,
                 alt.value("#7C3AED"),  # violet for selected note
                 alt.value("#4B90D9"),
             ),
@@ -141,7 +188,7 @@ def build_graph_spec(
             x=alt.X("x:Q", axis=None),
             y=alt.Y("y:Q", axis=None),
             text="slug:N",
-            opacity=alt.condition(alt.datum["highlighted"], alt.value(1.0), alt.value(0.65)),
+            opacity=alt.condition(is_highlighted, alt.value(1.0), alt.value(0.65)),
         )
     )
 
@@ -166,12 +213,15 @@ class _GraphViewPlugin:
     def __init__(self, descriptor: "PluginDescriptor") -> None:
         self.descriptor = descriptor
         self._index: "VaultIndex | None" = None
+        # (index version, highlight, chart) of the last render
+        self._last: tuple[int, str | None, Any] | None = None
 
     def on_load(self, index: "VaultIndex") -> None:
         self._index = index
 
     def on_index_update(self, index: "VaultIndex") -> None:
         self._index = index
+        self._last = None
 
     def on_note_select(self, slug: str, index: "VaultIndex") -> None:
         self._index = index
@@ -179,7 +229,12 @@ class _GraphViewPlugin:
     def render(self, highlight: str | None = None) -> Any:  # noqa: ANN401
         if self._index is None:
             raise RuntimeError("Plugin not loaded — call on_load first.")
-        return graph_panel_ui(self._index, highlight=highlight)
+        # The layout itself is cached per index version by build_graph_spec;
+        # this also hands back the same chart object for a repeated render
+        version = self._index.version
+        if self._last is None or self._last[:2] != (version, highlight):
+            self._last = (version, highlight, graph_panel_ui(self._index, highlight=highlight))
+        return self._last[2]
 
 
 def create_plugin(descriptor: "PluginDescriptor") -> "_GraphViewPlugin":
@@ -2,73 +2,281 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import re
+import sys
+from bisect import bisect_left
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
+from vault._fs import walk_markdown
 from vault.note import Note
 from vault.parser import parse_note
 
+#: Bump whenever :class:`Note` or the parser output changes shape (including
+#: the cached properties and ``__setstate__`` handling of pickled notes)
+_CACHE_VERSION = 2
+#: Below this many files to (re-)parse, a process pool costs more than it saves
+_PARALLEL_THRESHOLD = 200
+# Query words; must agree with the tokeniser behind Note.search_tokens
+_QUERY_WORD_RE = re.compile(r"\w+")
+
 
 class VaultIndex:
     """Scans a vault directory and builds backlink, tag, and graph indexes."""
 
-    def __init__(self, vault_dir: Path) -> None:
+    def __init__(
+        self, vault_dir: Path, *, persist_cache: bool = True, parallel: bool = True
+    ) -> None:
         self.vault_dir = Path(vault_dir)
+        self.persist_cache = persist_cache
+        #: Allow large re-parses to use a process pool (see :func:`_parse_paths`)
+        self.parallel = parallel
+        #: Bumped by :meth:`build` whenever the set of parsed notes changes;
+        #: renderers use it as a cache key.
+        self.version = 0
         self.notes: dict[str, Note] = {}
-        self.backlinks: dict[str, list[str]] = {}
-        self.tags: dict[str, list[str]] = {}
+        self.backlinks: dict[str, tuple[str, ...]] = {}
+        #: ``{slug, title}`` rows per linked-to slug, as shown in the backlinks panel
+        self.backlinks_rendered: dict[str, list[dict[str, str]]] = {}
+        #: The same rows pre-joined into a markdown bullet list
+        self.backlinks_md: dict[str, str] = {}
+        self.tags: dict[str, tuple[str, ...]] = {}
+        self._edges: list[tuple[str, str]] = []
+        #: Every tag name, sorted (dropdown options)
+        self.tag_options_sorted: tuple[str, ...] = ()
+        #: All notes ordered by case-insensitive title (sidebar order)
+        self.notes_sorted: list[Note] = []
+        self._tag_to_sorted_slugs: dict[str, list[str]] = {}
+        #: search word → slugs of the notes containing it
+        self._postings: dict[str, set[str]] = {}
+        self._sorted_tokens: list[str] = []
+        #: file path → ``(mtime_ns, size)`` of the file each parsed note came from
+        self._fingerprints: dict[str, tuple[int, int]] = {}
+        self._parsed: dict[str, Note] = {}
+        self._cache_loaded = False
 
     # ------------------------------------------------------------------
     # Build / refresh
     # ------------------------------------------------------------------
 
     def build(self) -> None:
-        """(Re-)scan the vault and rebuild all indexes."""
+        """(Re-)scan the vault and rebuild all indexes.
+
+        Only files whose ``(mtime_ns, size)`` differ from the previous build
+        are re-parsed; unchanged notes are reused and deleted files drop out.
+        With ``persist_cache`` the parsed notes are pickled to the user's
+        cache directory (see :func:`_cache_path`) so a fresh process starts
+        warm.
+        """
+        if self.persist_cache and not self._cache_loaded:
+            self._load_cache()
+
+        fingerprints: dict[str, tuple[int, int]] = {}
+        parsed: dict[str, Note] = {}
+        previous = self.notes
         self.notes = {}
-        for path in sorted(self.vault_dir.glob("**/*.md")):
-            note = parse_note(path)
+        entries = walk_markdown(str(self.vault_dir))
+        stale = [
+            path
+            for path, fingerprint in entries
+            if path not in self._parsed or self._fingerprints.get(path) != fingerprint
+        ]
+        fresh = dict(zip(stale, _parse_paths(stale, parallel=self.parallel), strict=True))
+        for path, fingerprint in entries:
+            note = fresh[path] if path in fresh else self._parsed[path]
+            fingerprints[path] = fingerprint
+            parsed[path] = note
             self.notes[note.slug] = note
-        self._build_backlinks()
-        self._build_tags()
 
-    def _build_backlinks(self) -> None:
-        self.backlinks = {slug: [] for slug in self.notes}
+        if self.notes.keys() != previous.keys() or any(
+            previous[slug] is not note for slug, note in self.notes.items()
+        ):
+            self.version += 1
+        dirty = fingerprints != self._fingerprints
+        self._fingerprints = fingerprints
+        self._parsed = parsed
+        self.notes_sorted = sorted(self.notes.values(), key=lambda n: str(n.title).lower())
+        self._build_links_and_tags()
+        self._build_postings()
+        if self.persist_cache and dirty:
+            self._save_cache()
+
+    def optimize(self) -> None:
+        """Discard the parse caches and rebuild every index from scratch."""
+        self._fingerprints = {}
+        self._parsed = {}
+        self.build()
+
+    def _load_cache(self) -> None:
+        self._cache_loaded = True
+        try:
+            with open(_cache_path(self.vault_dir), "rb") as fh:
+                version, fingerprints, parsed = pickle.load(fh)
+        except Exception:  # noqa: BLE001
+            # Missing, stale, or corrupt cache — fall back to a cold build
+            return
+        if version == _CACHE_VERSION:
+            self._fingerprints = fingerprints
+            self._parsed = parsed
+
+    def _save_cache(self) -> None:
+        try:
+            cache_path = _cache_path(self.vault_dir)
+            tmp_path = cache_path.with_suffix(".tmp")
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(
+                    (_CACHE_VERSION, self._fingerprints, self._parsed),
+                    fh,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, cache_path)
+        except (OSError, RuntimeError):
+            # No writable cache directory (or no home directory at all): the
+            # in-memory cache still makes rebuilds cheap
+            pass
+
+    def _build_links_and_tags(self) -> None:
+        # One sweep over every note fills the edge list, its inverse, and tag
+        # membership; each link is normalised exactly once.  Insertion-ordered
+        # dicts serve as sets, so dedup is O(1) and ordering stays stable.
+        backlinks: dict[str, dict[str, None]] = {slug: {} for slug in self.notes}
+        tags: dict[str, dict[str, None]] = {}
+        self._edges = []
         for slug, note in self.notes.items():
             for link in note.links:
                 target = self._normalise_link(link)
-                self.backlinks.setdefault(target, [])
-                if slug not in self.backlinks[target]:
-                    self.backlinks[target].append(slug)
+                self._edges.append((slug, target))
+                backlinks.setdefault(target, {})[slug] = None
+            for tag in note.tags:
+                tags.setdefault(tag, {})[slug] = None
 
-    def _build_tags(self) -> None:
-        self.tags = {}
+        # Read-only until the next build
+        self.backlinks = {target: tuple(sources) for target, sources in backlinks.items()}
+        self.tags = {tag: tuple(slugs) for tag, slugs in tags.items()}
+
+        self.backlinks_rendered = {}
+        self.backlinks_md = {}
+        for target, sources in self.backlinks.items():
+            if sources:
+                rows = [{"slug": s, "title": self.notes[s].title} for s in sources]
+                self.backlinks_rendered[target] = rows
+                self.backlinks_md[target] = "\n".join(
+                    f"- **{r['title']}** (`{r['slug']}`)" for r in rows
+                )
+
+        # YAML may hand back numeric tags (``tags: [2024]``) next to strings
+        self.tag_options_sorted = tuple(sorted(self.tags, key=str))
+        rank = {note.slug: i for i, note in enumerate(self.notes_sorted)}
+        self._tag_to_sorted_slugs = {
+            tag: sorted(slugs, key=rank.__getitem__) for tag, slugs in self.tags.items()
+        }
+
+    def _build_postings(self) -> None:
+        self._postings = {}
         for slug, note in self.notes.items():
-            for tag in note.tags:
-                self.tags.setdefault(tag, [])
-                if slug not in self.tags[tag]:
-                    self.tags[tag].append(slug)
+            for token in note.search_tokens:
+                self._postings.setdefault(token, set()).add(slug)
+        self._sorted_tokens = sorted(self._postings)
 
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
 
     @staticmethod
+    @lru_cache(maxsize=65536)
     def _normalise_link(link: str) -> str:
-        """Convert a wikilink target to a slug (strip path / extension)."""
-        return Path(link).stem if ("/" in link or link.endswith(".md")) else link
+        """Convert a wikilink target to a slug (strip path / extension).
+
+        Memoised, and path-style targets are interned, so each distinct
+        target costs one ``Path`` allocation per process.
+        """
+        if "/" in link or link.endswith(".md"):
+            return sys.intern(Path(link).stem)
+        return link
 
     def edges(self) -> list[tuple[str, str]]:
         """Return ``(source_slug, target_slug)`` pairs for every wikilink."""
-        result: list[tuple[str, str]] = []
-        for slug, note in self.notes.items():
-            for link in note.links:
-                result.append((slug, self._normalise_link(link)))
-        return result
+        return list(self._edges)
+
+    def iter_edges(self) -> Iterator[tuple[str, str]]:
+        """Iterate over :meth:`edges` without copying the cached list."""
+        return iter(self._edges)
 
     def search(self, query: str) -> list[Note]:
-        """Case-insensitive full-text search across title and body."""
+        """Case-insensitive full-text search across title and body.
+
+        Every word in *query* must be a prefix of some word in the note, so
+        results narrow as the user types.  Queries without any word
+        characters fall back to a plain substring scan.  Results come back
+        in :attr:`notes_sorted` order.
+        """
         q = query.lower()
-        return [n for n in self.notes.values() if q in n.title.lower() or q in n.body.lower()]
+        words = _QUERY_WORD_RE.findall(q)
+        if not words:
+            return [
+                n for n in self.notes_sorted if q in str(n.title).lower() or q in n.body.lower()
+            ]
+
+        hits: set[str] | None = None
+        for word in words:
+            matched = self._prefix_matches(word)
+            hits = matched if hits is None else hits & matched
+            if not hits:
+                return []
+        return [n for n in self.notes_sorted if n.slug in hits]
+
+    def _prefix_matches(self, prefix: str) -> set[str]:
+        """Union of postings for every indexed word starting with *prefix*."""
+        tokens = self._sorted_tokens
+        result: set[str] = set()
+        i = bisect_left(tokens, prefix)
+        while i < len(tokens) and tokens[i].startswith(prefix):
+            result |= self._postings[tokens[i]]
+            i += 1
+        return result
 
     def notes_with_tag(self, tag: str) -> list[Note]:
-        slugs = self.tags.get(tag, [])
+        """Notes carrying *tag*, in :attr:`notes_sorted` order."""
+        slugs = self._tag_to_sorted_slugs.get(tag, [])
         return [self.notes[s] for s in slugs if s in self.notes]
+
+
+# ---------------------------------------------------------------------------
+# Parse cache and parsing
+# ---------------------------------------------------------------------------
+
+
+def _cache_path(vault_dir: Path) -> Path:
+    """Location of the pickled parse cache for *vault_dir*.
+
+    The cache is kept under ``$XDG_CACHE_HOME`` (default ``~/.cache``) and
+    never inside the vault: vaults are synced and shared, and unpickling a
+    file someone else planted there would run their code.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha256(os.fsencode(vault_dir.resolve())).hexdigest()[:16]
+    return Path(base) / "marimo-obsessed" / f"index-{key}.pkl"
+
+
+def _parse_paths(paths: list[str], *, parallel: bool = True) -> list[Note]:
+    """Parse *paths* in order, fanning out to a process pool for large batches."""
+    if not parallel or len(paths) < _PARALLEL_THRESHOLD:
+        return [parse_note(p) for p in paths]
+    workers = os.cpu_count() or 1
+    try:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # "spawn": forking a threaded host process (e.g. the marimo server) can deadlock
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            chunksize = max(1, len(paths) // (workers * 4))
+            return list(pool.map(parse_note, paths, chunksize=chunksize))
+    except (ImportError, NotImplementedError, OSError):
+        # No subprocess support (e.g. Pyodide) — parse in-process instead
+        return [parse_note(p) for p in paths]
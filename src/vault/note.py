@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+# Plain ``[[Target]]`` links, rendered in bold by the editor view
+_WIKILINK_RE = re.compile(r"\[\[([^\]|]+)\]\]")
+# Words indexed for full-text search
+_WORD_RE = re.compile(r"\w+")
+
 
 @dataclass
 class Note:
@@ -19,10 +27,36 @@ class Note:
     links: list[str] = field(default_factory=list)
     frontmatter: dict[str, Any] = field(default_factory=dict)
 
-    @property
+    @cached_property
     def slug(self) -> str:
-        """Filesystem-stable identifier derived from the filename stem."""
-        return self.path.stem
+        """Filesystem-stable identifier derived from the filename stem (interned)."""
+        return sys.intern(self.path.stem)
+
+    @cached_property
+    def body_rendered(self) -> str:
+        """Markdown body with ``[[WikiLinks]]`` rendered in bold (computed once)."""
+        return _WIKILINK_RE.sub(r"**\1**", self.body)
+
+    @cached_property
+    def tags_md(self) -> str:
+        """Tags as a line of inline-code ``#tag`` chips (computed once)."""
+        return " ".join(f"`#{t}`" for t in self.tags)
+
+    @cached_property
+    def search_tokens(self) -> frozenset[str]:
+        """Lower-cased, interned words of the title and body (search index keys)."""
+        words = _WORD_RE.findall(f"{self.title}\n{self.body}".lower())
+        return frozenset(map(sys.intern, words))
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Notes arrive pickled from parse workers and the on-disk cache;
+        # re-intern their identifiers so they share objects with the rest
+        # of the process, as freshly parsed notes do.
+        self.__dict__.update(state)
+        self.tags = [sys.intern(t) if isinstance(t, str) else t for t in self.tags]
+        self.links = [sys.intern(link) for link in self.links]
+        if "slug" in state:
+            self.slug = sys.intern(state["slug"])
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import re
+import sys
+from bisect import bisect_right
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
 
+try:
+    # libyaml-backed loader; same results as SafeLoader, much faster
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml (e.g. some Pyodide builds)
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from vault.note import Note
 
@@ -15,63 +23,151 @@ if TYPE_CHECKING:
 _WIKILINK_RE = re.compile(r"\[\[([^\]|#]+)(?:[|#][^\]]*)?\]\]")
 # Inline #tags (not inside code-spans or URLs)
 _TAG_RE = re.compile(r"(?<![`\w/#])#([\w/-]+)")
-# YAML front-matter block
-_FRONTMATTER_RE = re.compile(r"^---[ \t]*\n(.*?)\n---[ \t]*\n", re.DOTALL)
+# Both of the above in one alternation, so parse_note reads the body once.
+# Group 1 is a wikilink target, group 2 a tag; text inside [[...]] is never a tag.
+_SCAN_RE = re.compile(f"{_WIKILINK_RE.pattern}|{_TAG_RE.pattern}")
+# Single-line `code spans`; #tags inside them are not tags
+_CODESPAN_RE = re.compile(r"`[^`\n]+`")
+
+
+def _frontmatter_span(content: str) -> tuple[int, int, int] | None:
+    """Locate a leading ``---`` … ``---`` block with plain string scans.
+
+    Returns ``(yaml_start, yaml_end, body_start)``, or ``None`` when *content*
+    has no front-matter.  Both fence lines may carry trailing spaces or tabs.
+    """
+    if not content.startswith("---"):
+        return None
+    opening_end = content.find("\n", 3)
+    if opening_end == -1 or content[3:opening_end].strip(" \t"):
+        return None
+    yaml_start = opening_end + 1
+    pos = content.find("\n---", yaml_start)
+    while pos != -1:
+        closing_end = content.find("\n", pos + 4)
+        if closing_end == -1:
+            return None
+        if not content[pos + 4 : closing_end].strip(" \t"):
+            return yaml_start, pos, closing_end + 1
+        pos = content.find("\n---", pos + 1)
+    return None
 
 
 def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     """Split YAML front-matter from body text.
 
     Returns ``(metadata_dict, body)``; ``metadata_dict`` is empty when there
-    is no front-matter block.
+    is no front-matter block.  Only the header slice is handed to YAML, and a
+    note that does not start with ``---`` never reaches the loader at all.
     """
-    match = _FRONTMATTER_RE.match(content)
-    if not match:
+    span = _frontmatter_span(content)
+    if span is None:
         return {}, content
+    yaml_start, yaml_end, body_start = span
     try:
-        meta: dict[str, Any] = yaml.safe_load(match.group(1)) or {}
+        meta: dict[str, Any] = yaml.load(content[yaml_start:yaml_end], Loader=_SafeLoader) or {}
     except yaml.YAMLError:
         meta = {}
-    return meta, content[match.end() :]
+    return meta, content[body_start:]
+
+
+def parse_frontmatter_only(path: str | Path) -> dict[str, Any]:
+    """Return the YAML front-matter of the file at *path* without reading its body.
+
+    The file is read a line at a time only until the closing fence turns up,
+    so a large body is never loaded and each line is decoded and checked
+    once.  Fences are matched exactly as :func:`parse_frontmatter` does.
+    """
+    # surrogateescape defers decode errors to the header check below
+    with open(path, encoding="utf-8", errors="surrogateescape") as fh:
+        opening = fh.readline()
+        if not opening.startswith("---") or opening[3:].strip(" \t") != "\n":
+            return {}
+        lines: list[str] = []
+        for line in fh:
+            # The closing fence needs its own line after the first header line
+            if lines and line.startswith("---") and line[3:].strip(" \t") == "\n":
+                break
+            lines.append(line)
+        else:
+            return {}
+    # Strict decode of just the header: invalid UTF-8 raises as a full read would
+    header = "".join(lines).encode("utf-8", "surrogateescape").decode("utf-8")
+    try:
+        return yaml.load(header, Loader=_SafeLoader) or {}
+    except yaml.YAMLError:
+        return {}
 
 
 def parse_wikilinks(text: str) -> list[str]:
     """Return all ``[[WikiLink]]`` targets found in *text* (de-duped, ordered)."""
-    seen: set[str] = set()
-    result: list[str] = []
-    for m in _WIKILINK_RE.finditer(text):
-        target = m.group(1).strip()
-        if target not in seen:
-            seen.add(target)
-            result.append(target)
-    return result
+    # Interned: targets become backlink keys and repeat across the vault
+    return list(
+        dict.fromkeys(sys.intern(m.group(1).strip()) for m in _WIKILINK_RE.finditer(text))
+    )
 
 
 def parse_tags(text: str) -> list[str]:
     """Return all ``#tag`` values found in *text* (de-duped, ordered)."""
-    seen: set[str] = set()
-    result: list[str] = []
-    for m in _TAG_RE.finditer(text):
-        tag = m.group(1)
-        if tag not in seen:
-            seen.add(tag)
-            result.append(tag)
-    return result
-
-
-def parse_note(path: Path) -> "Note":
-    """Read a ``.md`` file and return a fully-populated :class:`Note`."""
+    starts, ends = _code_spans(text)
+    return list(
+        dict.fromkeys(
+            sys.intern(m.group(1))
+            for m in _TAG_RE.finditer(text)
+            if not _in_spans(m.start(), starts, ends)
+        )
+    )
+
+
+def _code_spans(text: str) -> tuple[list[int], list[int]]:
+    """Return ``(starts, ends)`` of the inline code spans in *text*."""
+    if "`" not in text:
+        return [], []
+    spans = [m.span() for m in _CODESPAN_RE.finditer(text)]
+    return [start for start, _ in spans], [end for _, end in spans]
+
+
+def _in_spans(pos: int, starts: list[int], ends: list[int]) -> bool:
+    i = bisect_right(starts, pos) - 1
+    return i >= 0 and pos < ends[i]
+
+
+def _scan_body(body: str) -> tuple[list[str], list[str]]:
+    """Return ``(wikilink targets, inline tags)`` from one pass over *body*."""
+    links: dict[str, None] = {}
+    tags: dict[str, None] = {}
+    starts, ends = _code_spans(body)
+    for m in _SCAN_RE.finditer(body):
+        target, tag = m.groups()
+        if target is not None:
+            links[sys.intern(target.strip())] = None
+        elif not _in_spans(m.start(), starts, ends):
+            tags[sys.intern(tag)] = None
+    return list(links), list(tags)
+
+
+def _intern_tag(tag: Any) -> Any:
+    return sys.intern(tag) if isinstance(tag, str) else tag
+
+
+def parse_note(path: str | Path) -> "Note":
+    """Read a ``.md`` file and return a fully-populated :class:`Note`.
+
+    *path* may be a plain string (as produced by the index's directory walk);
+    it is only wrapped in a :class:`Path` for the returned note.
+    """
     from vault.note import Note
 
-    content = path.read_text(encoding="utf-8")
+    with open(path, encoding="utf-8") as fh:
+        content = fh.read()
+    path = Path(path)
     frontmatter, body = parse_frontmatter(content)
 
-    links = parse_wikilinks(body)
-    inline_tags = parse_tags(body)
+    links, inline_tags = _scan_body(body)
     fm_tags: list[str] = frontmatter.get("tags") or []
     if isinstance(fm_tags, str):
         fm_tags = [t.strip() for t in fm_tags.split(",") if t.strip()]
-    all_tags = list(dict.fromkeys(fm_tags + inline_tags))
+    all_tags = list(dict.fromkeys([*map(_intern_tag, fm_tags), *inline_tags]))
 
     title: str = frontmatter.get("title") or path.stem
 
@@ -19,9 +19,13 @@ directory for ``*.toml`` files.
 from __future__ import annotations
 
 import importlib
+import importlib.util
+import os
 import sys
+import threading
 import tomllib
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
@@ -32,7 +36,7 @@ from vault.index import VaultIndex
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginDescriptor:
     id: str
     name: str
@@ -46,20 +50,19 @@ class PluginDescriptor:
     def from_dict(cls, data: dict[str, Any]) -> "PluginDescriptor":
         plugin = data.get("plugin", data)
         return cls(
-            id=plugin["id"],
-            name=plugin["name"],
-            version=plugin.get("version", "0.1.0"),
-            entry=plugin["entry"],
-            hooks=plugin.get("hooks", []),
-            ui=plugin.get("ui", {}),
-            meta={
-                k: v
-                for k, v in plugin.items()
-                if k not in {"id", "name", "version", "entry", "hooks", "ui"}
-            },
+            plugin["id"],
+            plugin["name"],
+            plugin.get("version", "0.1.0"),
+            plugin["entry"],
+            plugin.get("hooks", []),
+            plugin.get("ui", {}),
+            {k: v for k, v in plugin.items() if k not in _DESCRIPTOR_KEYS},
         )
 
 
+_DESCRIPTOR_KEYS = frozenset({"id", "name", "version", "entry", "hooks", "ui"})
+
+
 # ---------------------------------------------------------------------------
 # Protocol
 # ---------------------------------------------------------------------------
@@ -78,19 +81,41 @@ class VaultPlugin(Protocol):
 # Loader
 # ---------------------------------------------------------------------------
 
+# Parsed descriptors by path, with the (mtime_ns, size) they were read at: an
+# unchanged file is never re-parsed on reload
+_DESCRIPTOR_CACHE: dict[Path, tuple[int, int, PluginDescriptor]] = {}
+# Guards the sys.path check-and-insert when plugins load on worker threads
+_SYS_PATH_LOCK = threading.Lock()
+
+
+def _load_descriptor(descriptor_path: Path) -> PluginDescriptor:
+    st = descriptor_path.stat()
+    cached = _DESCRIPTOR_CACHE.get(descriptor_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        desc = cached[2]
+    else:
+        data = tomllib.loads(descriptor_path.read_bytes().decode("utf-8"))
+        desc = PluginDescriptor.from_dict(data)
+        _DESCRIPTOR_CACHE[descriptor_path] = (st.st_mtime_ns, st.st_size, desc)
+    # Each plugin gets its own containers, so the cached copy stays pristine
+    return replace(desc, hooks=list(desc.hooks), ui=dict(desc.ui), meta=dict(desc.meta))
+
 
 def load_plugin(descriptor_path: Path) -> VaultPlugin:
     """Load a single plugin from a ``.toml`` descriptor file."""
-    with open(descriptor_path, "rb") as fh:
-        data = tomllib.load(fh)
-
-    desc = PluginDescriptor.from_dict(data)
+    desc = _load_descriptor(descriptor_path)
 
     # Ensure src/ is on the path so vault.* modules are importable
     src_dir = descriptor_path.parent.parent / "src"
-    if src_dir.exists() and str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
+    if src_dir.exists():
+        with _SYS_PATH_LOCK:
+            if str(src_dir) not in sys.path:
+                sys.path.insert(0, str(src_dir))
+
+    # A missing entry module is the common broken-descriptor case: settle it
+    # with a finder lookup instead of a failed import
+    if importlib.util.find_spec(desc.entry) is None:
+        raise ModuleNotFoundError(f"No module named '{desc.entry}'", name=desc.entry)
     module = importlib.import_module(desc.entry)
 
     if not hasattr(module, "create_plugin"):
@@ -102,21 +127,45 @@ def load_plugin(descriptor_path: Path) -> VaultPlugin:
     return plugin
 
 
+def _try_load_plugin(toml_path: Path) -> VaultPlugin | None:
+    try:
+        return load_plugin(toml_path)
+    except Exception as exc:  # noqa: BLE001
+        # Log but don't hard-crash so remaining plugins still load
+        print(f"[warn] Failed to load plugin {toml_path.name}: {exc}", file=sys.stderr)
+        return None
+
+
 def load_all_plugins(plugins_dir: Path) -> list[VaultPlugin]:
-    """Load every ``*.toml`` plugin descriptor found in *plugins_dir*."""
+    """Load every ``*.toml`` plugin descriptor found in *plugins_dir*.
+
+    Descriptors are read and their modules imported on a thread pool (the
+    work is mostly file I/O); plugins are returned in file-name order.
+    """
     plugins_dir = Path(plugins_dir)
-    plugins: list[VaultPlugin] = []
-    for toml_path in sorted(plugins_dir.glob("*.toml")):
+    # scandir hands back names and file types without a stat per entry
+    try:
+        with os.scandir(plugins_dir) as entries:
+            names = sorted(e.name for e in entries if e.name.endswith(".toml") and e.is_file())
+    except FileNotFoundError:
+        return []
+    toml_paths = [plugins_dir / name for name in names]
+    if len(toml_paths) < 2:
+        loaded = list(map(_try_load_plugin, toml_paths))
+    else:
         try:
-            plugins.append(load_plugin(toml_path))
-        except Exception as exc:  # noqa: BLE001
-            # Log but don't hard-crash so remaining plugins still load
-            print(f"[warn] Failed to load plugin {toml_path.name}: {exc}", file=sys.stderr)
-    return plugins
+            with ThreadPoolExecutor(max_workers=min(32, len(toml_paths))) as pool:
+                loaded = list(pool.map(_try_load_plugin, toml_paths))
+        except RuntimeError:
+            # No threads available (e.g. Pyodide): load one by one
+            loaded = list(map(_try_load_plugin, toml_paths))
+    return [plugin for plugin in loaded if plugin is not None]
 
 
 def fire_hook(plugins: list[VaultPlugin], hook: str, **kwargs: Any) -> None:
     """Call *hook* on every plugin that declares it."""
     for plugin in plugins:
-        if hook in plugin.descriptor.hooks and hasattr(plugin, hook):
-            getattr(plugin, hook)(**kwargs)
+        if hook in plugin.descriptor.hooks:
+            method = getattr(plugin, hook, None)
+            if method is not None:
+                method(**kwargs)
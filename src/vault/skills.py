@@ -42,19 +42,28 @@ as the shorthand prefix *also* activates the todo quick-capture (see
 
 from __future__ import annotations
 
+import os
 import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from vault.parser import parse_frontmatter
+from vault._fs import walk_markdown
+from vault.parser import parse_frontmatter, parse_frontmatter_only
+
+# Shorthands remembered by SkillIndex.resolve_shorthand (typing and
+# backspacing in the command bar revisits the same prefixes)
+_RESOLVE_CACHE_SIZE = 256
+# Below this many skill files, a process pool costs more than it saves
+_PARALLEL_THRESHOLD = 200
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillDescriptor:
     """Metadata and markdown body of a single skill file."""
 
@@ -64,13 +73,35 @@ class SkillDescriptor:
     description: str
     triggers: list[str]
     tags: list[str]
-    body: str           # markdown body (frontmatter stripped)
+    # Markdown body (frontmatter stripped).  SkillIndex leaves it ``None`` and
+    # read_body() loads it from ``path`` on first use; it is derived from the
+    # file, so it takes no part in equality.
+    body: str | None = field(default=None, repr=False, compare=False)
     meta: dict[str, Any] = field(default_factory=dict)
+    # Lower-cased copies of the searchable fields, so queries never re-lower them
+    _name_lc: str = field(init=False, repr=False, compare=False)
+    _desc_lc: str = field(init=False, repr=False, compare=False)
+    _triggers_lc: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _tags_lc: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._name_lc = str(self.name).lower()
+        self._desc_lc = str(self.description).lower()
+        # Interned: triggers and tags repeat across skills and key _by_trigger
+        self._triggers_lc = tuple(sys.intern(str(t).lower()) for t in self.triggers)
+        self._tags_lc = tuple(sys.intern(str(t).lower()) for t in self.tags)
 
     @property
     def slug(self) -> str:
         return self.path.stem
 
+    def read_body(self) -> str:
+        """Return :attr:`body`, reading it from ``path`` if it was not loaded yet."""
+        if self.body is None:
+            with open(self.path, encoding="utf-8") as fh:
+                _, self.body = parse_frontmatter(fh.read())
+        return self.body
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "slug": self.slug,
@@ -90,46 +121,91 @@ class SkillDescriptor:
 class SkillIndex:
     """Scans a ``skills/`` directory and indexes all skill descriptors."""
 
-    def __init__(self, skills_dir: Path) -> None:
+    def __init__(self, skills_dir: Path, *, parallel: bool = True) -> None:
         self.skills_dir = Path(skills_dir)
+        self.parallel = parallel
         self.skills: dict[str, SkillDescriptor] = {}
+        # lower-cased trigger → skills declaring it, in slug order
+        self._by_trigger: dict[str, list[SkillDescriptor]] = {}
+        # 3-gram of any lower-cased searchable field → slugs containing it
+        self._trigrams: dict[str, set[str]] = {}
+        # slug → position in self.skills, to return candidates in index order
+        self._rank: dict[str, int] = {}
+        # normalised shorthand → resolved skills, most recently used last
+        self._resolve_cache: OrderedDict[str, list[SkillDescriptor]] = OrderedDict()
 
     def build(self) -> None:
         """(Re-)scan the skills directory."""
         self.skills = {}
-        if not self.skills_dir.exists():
-            return
-        for path in sorted(self.skills_dir.glob("**/*.md")):
-            try:
-                skill = _parse_skill(path)
-                self.skills[skill.slug] = skill
-            except Exception as exc:  # noqa: BLE001
-                print(f"[warn] Failed to load skill {path.name}: {exc}", file=sys.stderr)
+        self._by_trigger = {}
+        self._trigrams = {}
+        self._rank = {}
+        self._resolve_cache = OrderedDict()
+        # Same order as sorted(glob("**/*.md")); a missing directory yields nothing
+        paths = [Path(p) for p, _ in walk_markdown(str(self.skills_dir))]
+        for path, result in zip(paths, _parse_skills(paths, parallel=self.parallel), strict=True):
+            if isinstance(result, Exception):
+                print(f"[warn] Failed to load skill {path.name}: {result}", file=sys.stderr)
+            else:
+                self.skills[result.slug] = result
+        for rank, (slug, skill) in enumerate(self.skills.items()):
+            self._rank[slug] = rank
+            for trigger in dict.fromkeys(skill._triggers_lc):
+                self._by_trigger.setdefault(trigger, []).append(skill)
+            for text in (skill._name_lc, skill._desc_lc, *skill._triggers_lc, *skill._tags_lc):
+                for i in range(len(text) - 2):
+                    self._trigrams.setdefault(text[i : i + 3], set()).add(slug)
 
     def search(self, query: str) -> list[SkillDescriptor]:
-        """Full-text search over name, description, and triggers."""
+        """Full-text search over name, description, and triggers.
+
+        Queries of three or more characters only check the skills that
+        contain all of the query's trigrams; shorter ones scan every skill.
+        """
         q = query.lower()
+        if len(q) < 3:
+            return [s for s in self.skills.values() if _matches(s, q)]
+        postings = []
+        for gram in {q[i : i + 3] for i in range(len(q) - 2)}:
+            posting = self._trigrams.get(gram)
+            if not posting:
+                return []  # a trigram no skill contains: nothing can match
+            postings.append(posting)
+        # Smallest posting first, so every intersection step stays small
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
         return [
             s
-            for s in self.skills.values()
-            if q in s.name.lower()
-            or q in s.description.lower()
-            or any(q in t.lower() for t in s.triggers)
-            or any(q in t.lower() for t in s.tags)
+            for s in map(self.skills.__getitem__, sorted(candidates, key=self._rank.__getitem__))
+            if _matches(s, q)
         ]
 
     def by_trigger(self, trigger: str) -> list[SkillDescriptor]:
         """Return skills whose triggers exactly match *trigger* (case-insensitive)."""
-        t = trigger.lower()
-        return [s for s in self.skills.values() if any(t == tr.lower() for tr in s.triggers)]
+        return list(self._by_trigger.get(trigger.lower(), ()))
 
     def resolve_shorthand(self, text: str) -> list[SkillDescriptor]:
         """Resolve a free-text shorthand to matching skills (prefix or exact trigger)."""
         t = text.lower().strip()
-        exact = self.by_trigger(t)
-        if exact:
-            return exact
-        return self.search(t)
+        cached = self._resolve_cache.get(t)
+        if cached is None:
+            cached = self.by_trigger(t) or self.search(t)
+            self._resolve_cache[t] = cached
+            if len(self._resolve_cache) > _RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+        else:
+            self._resolve_cache.move_to_end(t)
+        return list(cached)
+
+
+def _matches(skill: SkillDescriptor, q: str) -> bool:
+    """Return whether lower-cased *q* occurs in any searchable field of *skill*."""
+    return (
+        q in skill._name_lc
+        or q in skill._desc_lc
+        or any(q in t for t in skill._triggers_lc)
+        or any(q in t for t in skill._tags_lc)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -137,9 +213,41 @@ class SkillIndex:
 # ---------------------------------------------------------------------------
 
 
+def _parse_skills(
+    paths: list[Path], *, parallel: bool = True
+) -> list[SkillDescriptor | Exception]:
+    """Parse *paths* in order, fanning out to a process pool for large batches.
+
+    A file that fails to parse yields its exception instead of a descriptor,
+    so one bad skill never aborts the batch.
+    """
+    if not parallel or len(paths) < _PARALLEL_THRESHOLD:
+        return [_try_parse_skill(p) for p in paths]
+    workers = os.cpu_count() or 1
+    try:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # "spawn": forking a threaded host process (e.g. the marimo server) can deadlock
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            chunksize = max(1, len(paths) // (workers * 4))
+            return list(pool.map(_try_parse_skill, paths, chunksize=chunksize))
+    except (ImportError, NotImplementedError, OSError):
+        # No subprocess support (e.g. Pyodide) — parse in-process instead
+        return [_try_parse_skill(p) for p in paths]
+
+
+def _try_parse_skill(path: Path) -> SkillDescriptor | Exception:
+    try:
+        return _parse_skill(path)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+
+
 def _parse_skill(path: Path) -> SkillDescriptor:
-    content = path.read_text(encoding="utf-8")
-    meta, body = parse_frontmatter(content)
+    # Indexing only needs the metadata; the body is read if it is ever shown
+    meta = parse_frontmatter_only(path)
 
     triggers = meta.get("triggers") or []
     if isinstance(triggers, str):
@@ -148,6 +256,8 @@ def _parse_skill(path: Path) -> SkillDescriptor:
     tags = meta.get("tags") or []
     if isinstance(tags, str):
         tags = [t.strip() for t in tags.split(",") if t.strip()]
+    triggers = [sys.intern(t) if isinstance(t, str) else t for t in triggers]
+    tags = [sys.intern(t) if isinstance(t, str) else t for t in tags]
 
     return SkillDescriptor(
         path=path,
@@ -156,7 +266,6 @@ def _parse_skill(path: Path) -> SkillDescriptor:
         description=meta.get("description", ""),
         triggers=triggers,
         tags=tags,
-        body=body,
         meta={
             k: v
             for k, v in meta.items()
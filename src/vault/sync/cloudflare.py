@@ -15,6 +15,10 @@ GET  /canvas/{canvas_id}     – retrieve canvas snapshot
 All endpoints accept/return JSON.  The Worker authenticates callers by
 inspecting the ``Authorization: Bearer <token>`` header.
 
+The single-item GET routes should pass through the R2 object's ``ETag`` and
+answer ``If-None-Match`` with ``304 Not Modified``; the client then reuses
+the payload it already holds.
+
 Environment variables (all optional; direct kwargs take precedence):
     VAULT_CF_WORKER_URL   – base URL of the worker (e.g. https://vault.example.workers.dev)
     VAULT_CF_API_TOKEN    – Cloudflare API token / shared secret
@@ -22,11 +26,23 @@ Environment variables (all optional; direct kwargs take precedence):
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import os
-from typing import Any
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
+from vault import _json
 from vault.note import Note
 
+if TYPE_CHECKING:
+    import httpx
+
+# Concurrent per-note GETs in pull_all_notes, within Worker subrequest limits
+_PULL_CONCURRENCY = 32
+# Most recent GET payloads kept for ETag revalidation
+_ETAG_CACHE_SIZE = 1024
+
 
 class CloudflareWorkerClient:
     """HTTP sync backend backed by a Cloudflare Worker + R2."""
@@ -42,33 +58,61 @@ class CloudflareWorkerClient:
 
         self._base_url = (worker_url or os.getenv("VAULT_CF_WORKER_URL", "")).rstrip("/")
         self._token = api_token or os.getenv("VAULT_CF_API_TOKEN", "")
-        self._client = httpx.Client(
-            base_url=self._base_url,
-            headers={"Authorization": f"Bearer {self._token}", "Content-Type": "application/json"},
-            timeout=timeout,
-        )
+        self._client_kwargs: dict[str, Any] = {
+            "base_url": self._base_url,
+            "headers": {
+                "Authorization": f"Bearer {self._token}",
+                "Content-Type": "application/json",
+            },
+            "timeout": timeout,
+            # Multiplex requests over one connection when the h2 extra is installed
+            "http2": importlib.util.find_spec("h2") is not None,
+        }
+        self._client = httpx.Client(**self._client_kwargs)
+        self._async_client: httpx.AsyncClient | None = None
+        # request path → (ETag, payload), least recently used first
+        self._etag_cache: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+
+    def _get_json(self, path: str) -> dict[str, Any] | None:
+        """GET *path*, revalidating a cached payload; ``None`` on 404."""
+        r = self._client.get(path, headers=self._conditional_headers(path))
+        return self._read_json(path, r)
+
+    def _conditional_headers(self, path: str) -> dict[str, str] | None:
+        cached = self._etag_cache.get(path)
+        return {"If-None-Match": cached[0]} if cached is not None else None
+
+    def _read_json(self, path: str, r: "httpx.Response") -> dict[str, Any] | None:
+        """Decode the GET response for *path*, updating the ETag cache."""
+        cached = self._etag_cache.get(path)
+        if r.status_code == 304 and cached is not None:
+            self._etag_cache.move_to_end(path)
+            return cached[1]
+        if r.status_code == 404:
+            self._etag_cache.pop(path, None)
+            return None
+        r.raise_for_status()
+        payload = _json.loads(r.content)
+        etag = r.headers.get("ETag")
+        if etag:
+            self._etag_cache[path] = (etag, payload)
+            self._etag_cache.move_to_end(path)
+            if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        else:
+            self._etag_cache.pop(path, None)
+        return payload
 
     # ------------------------------------------------------------------
     # Notes
     # ------------------------------------------------------------------
 
     def push_note(self, note: Note) -> None:
-        self._client.put(
-            f"/notes/{note.slug}",
-            json={
-                "title": note.title,
-                "body": note.body,
-                "tags": note.tags,
-                "links": note.links,
-            },
-        ).raise_for_status()
+        payload = {"title": note.title, "body": note.body, "tags": note.tags, "links": note.links}
+        self._client.put(f"/notes/{note.slug}", content=_json.dumps(payload)).raise_for_status()
 
     def pull_note(self, slug: str) -> dict[str, Any] | None:
-        r = self._client.get(f"/notes/{slug}")
-        if r.status_code == 404:
-            return None
-        r.raise_for_status()
-        return r.json()
+        return self._get_json(f"/notes/{slug}")
 
     def list_notes(self) -> list[str]:
         r = self._client.get("/notes")
@@ -76,37 +120,86 @@ class CloudflareWorkerClient:
         return r.json().get("slugs", [])
 
     def pull_all_notes(self) -> list[dict[str, Any]]:
-        slugs = self.list_notes()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._pull_all_with_new_client())
+        # Already inside an event loop (e.g. Pyodide): fetch one by one
         notes = []
-        for slug in slugs:
+        for slug in self.list_notes():
             note = self.pull_note(slug)
             if note is not None:
                 notes.append(note)
         return notes
 
+    async def pull_all_notes_async(self) -> list[dict[str, Any]]:
+        """Fetch every note, issuing the per-note GETs concurrently.
+
+        The first call opens an async client that :meth:`close` cannot shut
+        down; release it with :meth:`aclose` or ``async with``.
+        """
+        import httpx
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_kwargs)
+        return await self._pull_all(self._async_client)
+
+    async def _pull_all_with_new_client(self) -> list[dict[str, Any]]:
+        # An AsyncClient is bound to the loop it first ran on, and
+        # asyncio.run() starts a fresh loop each time
+        import httpx
+
+        async with httpx.AsyncClient(**self._client_kwargs) as client:
+            return await self._pull_all(client)
+
+    async def _pull_all(self, client: "httpx.AsyncClient") -> list[dict[str, Any]]:
+        r = await client.get("/notes")
+        r.raise_for_status()
+        slugs: list[str] = r.json().get("slugs", [])
+        limit = asyncio.Semaphore(_PULL_CONCURRENCY)
+
+        async def fetch(slug: str) -> dict[str, Any] | None:
+            path = f"/notes/{slug}"
+            async with limit:
+                r = await client.get(path, headers=self._conditional_headers(path))
+            return self._read_json(path, r)
+
+        notes = await asyncio.gather(*(fetch(slug) for slug in slugs))
+        return [note for note in notes if note is not None]
+
     # ------------------------------------------------------------------
     # Canvas
     # ------------------------------------------------------------------
 
     def push_canvas(self, canvas_id: str, state: dict[str, Any]) -> None:
-        self._client.put(f"/canvas/{canvas_id}", json=state).raise_for_status()
+        self._client.put(f"/canvas/{canvas_id}", content=_json.dumps(state)).raise_for_status()
 
     def pull_canvas(self, canvas_id: str) -> dict[str, Any] | None:
-        r = self._client.get(f"/canvas/{canvas_id}")
-        if r.status_code == 404:
-            return None
-        r.raise_for_status()
-        return r.json()
+        return self._get_json(f"/canvas/{canvas_id}")
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def close(self) -> None:
+        """Close the sync client (use :meth:`aclose` after :meth:`pull_all_notes_async`)."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close both clients, including the one used by :meth:`pull_all_notes_async`."""
         self._client.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     def __enter__(self) -> "CloudflareWorkerClient":
         return self
 
     def __exit__(self, *_: object) -> None:
         self.close()
+
+    async def __aenter__(self) -> "CloudflareWorkerClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
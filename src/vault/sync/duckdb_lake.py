@@ -8,7 +8,7 @@ Sync flow
 ---------
 1. On startup ``DuckLakeSync.__init__`` creates a local DuckDB connection and
    attaches (or creates) the DuckLake catalog.
-2. ``push_note`` / ``push_canvas`` write records into the attached catalog;
+2. ``push_note`` / ``push_notes`` / ``push_canvas`` write records into the attached catalog;
    DuckLake automatically writes Parquet to R2.
 3. ``pull_*`` methods run SQL queries through DuckDB, which reads Parquet
    directly from R2 — no intermediate download step needed.
@@ -25,19 +25,54 @@ Environment variables (all optional; direct kwargs take precedence):
 
 from __future__ import annotations
 
-import json
 import os
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from vault import _json
 from vault.note import Note
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _sql_literal(value: str) -> str:
+    """Quote *value* as a SQL string literal (for DDL, which takes no parameters)."""
+    return "'" + value.replace("'", "''") + "'"
+
 
 class DuckLakeSync:
     """Local-first sync backend backed by DuckDB + DuckLake on Cloudflare R2."""
 
     _CATALOG = "vault"
 
+    # Statement text is fixed per class: the catalog name is interpolated
+    # once here, and every data value is bound as a parameter
+    _PUSH_NOTES_SQL = f"""
+        INSERT INTO {_CATALOG}.notes (slug, title, body, tags, links, updated_at)
+        SELECT slug, title, body, tags, links, now() FROM _incoming_notes
+        ON CONFLICT (slug) DO UPDATE SET
+            title      = excluded.title,
+            body       = excluded.body,
+            tags       = excluded.tags,
+            links      = excluded.links,
+            updated_at = now();
+    """
+    _PULL_NOTE_SQL = f"SELECT slug, title, body, tags, links FROM {_CATALOG}.notes WHERE slug = ?"
+    _LIST_NOTES_SQL = f"SELECT slug FROM {_CATALOG}.notes ORDER BY slug"
+    _PULL_ALL_NOTES_SQL = (
+        f"SELECT slug, title, body, tags, links FROM {_CATALOG}.notes ORDER BY slug"
+    )
+    _PUSH_CANVAS_SQL = f"""
+        INSERT INTO {_CATALOG}.canvas_state (canvas_id, state, updated_at)
+        VALUES (?, ?, now())
+        ON CONFLICT (canvas_id) DO UPDATE SET
+            state      = excluded.state,
+            updated_at = now();
+    """
+    _PULL_CANVAS_SQL = f"SELECT state FROM {_CATALOG}.canvas_state WHERE canvas_id = ?"
+
     def __init__(
         self,
         db_path: Path | str = ":memory:",
@@ -70,9 +105,9 @@ class DuckLakeSync:
             self.conn.execute(f"""
                 CREATE SECRET IF NOT EXISTS r2_secret (
                     TYPE s3,
-                    ENDPOINT '{self._r2_endpoint}',
-                    KEY_ID '{self._access_key}',
-                    SECRET '{self._secret_key}',
+                    ENDPOINT {_sql_literal(self._r2_endpoint)},
+                    KEY_ID {_sql_literal(self._access_key)},
+                    SECRET {_sql_literal(self._secret_key)},
                     REGION 'auto'
                 );
             """)
@@ -84,8 +119,8 @@ class DuckLakeSync:
             catalog_uri = f"ducklake:{Path(self._db_path).parent / 'vault.ducklake'}"
 
         self.conn.execute(f"""
-            ATTACH IF NOT EXISTS '{catalog_uri}' AS {self._CATALOG}
-            (DATA_PATH '{data_path}');
+            ATTACH IF NOT EXISTS {_sql_literal(catalog_uri)} AS {self._CATALOG}
+            (DATA_PATH {_sql_literal(data_path)});
         """)
         self._ensure_schema()
 
@@ -114,70 +149,69 @@ class DuckLakeSync:
     # ------------------------------------------------------------------
 
     def push_note(self, note: Note) -> None:
-        c = self._CATALOG
-        self.conn.execute(
-            f"""
-            INSERT INTO {c}.notes (slug, title, body, tags, links, updated_at)
-            VALUES (?, ?, ?, ?, ?, now())
-            ON CONFLICT (slug) DO UPDATE SET
-                title      = excluded.title,
-                body       = excluded.body,
-                tags       = excluded.tags,
-                links      = excluded.links,
-                updated_at = now();
-            """,
-            [note.slug, note.title, note.body, note.tags, note.links],
+        self.push_notes([note])
+
+    def push_notes(self, notes: Iterable[Note]) -> None:
+        """Upsert many notes with one ``INSERT`` over an Arrow table.
+
+        When the same slug appears more than once, the last note wins.
+        """
+        import pyarrow as pa
+
+        # One row per slug: DuckDB refuses to upsert the same key twice in
+        # a single statement
+        by_slug = {note.slug: note for note in notes}
+        if not by_slug:
+            return
+        batch = list(by_slug.values())
+        # Arrow will not cast YAML numbers (``title: 1984``, ``tags: [2024]``)
+        # to string columns, so convert them first
+        table = pa.table(
+            {
+                "slug": pa.array([n.slug for n in batch], type=pa.string()),
+                "title": pa.array([str(n.title) for n in batch], type=pa.string()),
+                "body": pa.array([n.body for n in batch], type=pa.string()),
+                "tags": pa.array(
+                    [list(map(str, n.tags)) for n in batch], type=pa.list_(pa.string())
+                ),
+                "links": pa.array([n.links for n in batch], type=pa.list_(pa.string())),
+            }
         )
+        self.conn.register("_incoming_notes", table)
+        try:
+            self.conn.execute(self._PUSH_NOTES_SQL)
+        finally:
+            self.conn.unregister("_incoming_notes")
 
     def pull_note(self, slug: str) -> dict[str, Any] | None:
-        c = self._CATALOG
-        row = self.conn.execute(
-            f"SELECT slug, title, body, tags, links FROM {c}.notes WHERE slug = ?",
-            [slug],
-        ).fetchone()
+        row = self.conn.execute(self._PULL_NOTE_SQL, [slug]).fetchone()
         if row is None:
             return None
         return dict(zip(["slug", "title", "body", "tags", "links"], row, strict=False))
 
     def list_notes(self) -> list[str]:
-        c = self._CATALOG
-        rows = self.conn.execute(f"SELECT slug FROM {c}.notes ORDER BY slug").fetchall()
-        return [r[0] for r in rows]
+        return self.conn.execute(self._LIST_NOTES_SQL).fetchnumpy()["slug"].tolist()
 
     def pull_all_notes(self) -> list[dict[str, Any]]:
-        c = self._CATALOG
-        df = self.conn.execute(
-            f"SELECT slug, title, body, tags, links FROM {c}.notes ORDER BY slug"
-        ).df()
-        return df.to_dict("records")
+        return self.pull_all_notes_arrow().to_pylist()
+
+    def pull_all_notes_arrow(self) -> "pa.Table":
+        """Fetch every note as a columnar Arrow table (no per-row objects)."""
+        return self.conn.execute(self._PULL_ALL_NOTES_SQL).fetch_arrow_table()
 
     # ------------------------------------------------------------------
     # Canvas
     # ------------------------------------------------------------------
 
     def push_canvas(self, canvas_id: str, state: dict[str, Any]) -> None:
-        c = self._CATALOG
-        self.conn.execute(
-            f"""
-            INSERT INTO {c}.canvas_state (canvas_id, state, updated_at)
-            VALUES (?, ?, now())
-            ON CONFLICT (canvas_id) DO UPDATE SET
-                state      = excluded.state,
-                updated_at = now();
-            """,
-            [canvas_id, json.dumps(state)],
-        )
+        self.conn.execute(self._PUSH_CANVAS_SQL, [canvas_id, _json.dumps(state)])
 
     def pull_canvas(self, canvas_id: str) -> dict[str, Any] | None:
-        c = self._CATALOG
-        row = self.conn.execute(
-            f"SELECT state FROM {c}.canvas_state WHERE canvas_id = ?",
-            [canvas_id],
-        ).fetchone()
+        row = self.conn.execute(self._PULL_CANVAS_SQL, [canvas_id]).fetchone()
         if row is None:
             return None
         raw = row[0]
-        return json.loads(raw) if isinstance(raw, str) else raw
+        return _json.loads(raw) if isinstance(raw, str) else raw
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -10,6 +10,8 @@ Supported patterns (matched line-by-line, case-insensitive)
 - ``TK: revise introduction``     — Explicit inline TK with description
 - ``TK``                          — Bare marker; surrounding line used as context
 
+Markers inside fenced code blocks and ``<!-- HTML comments -->`` are ignored.
+
 Quick-capture shorthand
 -----------------------
 Typing ``tk <description>`` in the vault app's command bar appends a new
@@ -19,7 +21,10 @@ and triggers an index rebuild so the new todo appears immediately.
 
 from __future__ import annotations
 
+import os
 import re
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
@@ -27,6 +32,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from vault.index import VaultIndex
+    from vault.note import Note
 
 # ---------------------------------------------------------------------------
 # Regex patterns
@@ -39,8 +45,15 @@ _COLON_TK_RE = re.compile(r"^\s*TK:\s*(.+)$", re.IGNORECASE)
 # Bare TK anywhere on a line (last resort)
 _BARE_TK_RE = re.compile(r"\bTK\b", re.IGNORECASE)
 
-# Lines to skip (code fences, HTML comments)
-_SKIP_RE = re.compile(r"^\s*(```|~~~|<!--)")
+#: Below this many notes to scan, a process pool costs more than it saves.
+#: Scanning is cheap per note (most are settled by one search), so the
+#: bar sits well above the index's parse threshold.
+_PARALLEL_THRESHOLD = 2000
+
+# Code-fence line ("```" / "~~~", optionally with an info string)
+_FENCE_RE = re.compile(r"^[^\S\n]*(?:```|~~~)[^\n]*$", re.MULTILINE)
+# Start of a skipped region: a fence line or an HTML comment opener
+_SKIP_START_RE = re.compile(f"{_FENCE_RE.pattern}|<!--", re.MULTILINE)
 
 
 # ---------------------------------------------------------------------------
@@ -48,7 +61,7 @@ _SKIP_RE = re.compile(r"^\s*(```|~~~|<!--)")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoItem:
     source_slug: str   # slug of the note that contains the marker
     line_no: int       # 1-based line number
@@ -56,6 +69,10 @@ class TodoItem:
     raw_line: str      # original unmodified line
     resolved: bool = False
 
+    def __post_init__(self) -> None:
+        # Interned, so grouping by note compares pointers and shares the slug
+        self.source_slug = sys.intern(self.source_slug)
+
     def to_dict(self) -> dict:
         return {
             "source_slug": self.source_slug,
@@ -65,9 +82,24 @@ class TodoItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoIndex:
     items: list[TodoItem] = field(default_factory=list)
+    # slug → (note object scanned, its items); lets the next scan skip unchanged notes
+    _scanned: dict[str, tuple["Note", list[TodoItem]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (``items`` list and its length when grouped, slug → items)
+    _by_note: tuple[list[TodoItem], int, dict[str, list[TodoItem]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def append_item(self, item: TodoItem) -> None:
+        """Add *item*, updating :attr:`by_note` in place rather than regrouping."""
+        by_note = self.by_note
+        self.items.append(item)
+        by_note.setdefault(item.source_slug, []).append(item)
+        self._by_note = (self.items, len(self.items), by_note)
 
     @property
     def pending(self) -> list[TodoItem]:
@@ -75,10 +107,14 @@ class TodoIndex:
 
     @property
     def by_note(self) -> dict[str, list[TodoItem]]:
-        result: dict[str, list[TodoItem]] = {}
-        for item in self.items:
-            result.setdefault(item.source_slug, []).append(item)
-        return result
+        """Items grouped by source note; regrouped when ``items`` is replaced or resized."""
+        cached = self._by_note
+        if cached is None or cached[0] is not self.items or cached[1] != len(self.items):
+            grouped: dict[str, list[TodoItem]] = {}
+            for item in self.items:
+                grouped.setdefault(item.source_slug, []).append(item)
+            cached = self._by_note = (self.items, len(self.items), grouped)
+        return cached[2]
 
 
 # ---------------------------------------------------------------------------
@@ -86,47 +122,149 @@ class TodoIndex:
 # ---------------------------------------------------------------------------
 
 
-def scan_todos(index: "VaultIndex") -> TodoIndex:
-    """Scan every note in *index* for TK markers and return a :class:`TodoIndex`."""
+def scan_todos(
+    index: "VaultIndex", previous: TodoIndex | None = None, *, parallel: bool = True
+) -> TodoIndex:
+    """Scan every note in *index* for TK markers and return a :class:`TodoIndex`.
+
+    Pass the *previous* result to rescan incrementally: notes that
+    :meth:`VaultIndex.build` reused unchanged keep their earlier items.
+    Large batches of notes to scan are spread over a process pool unless
+    *parallel* is false.
+    """
+    scanned = previous._scanned if previous is not None else {}
+    stale = [
+        slug
+        for slug, note in index.notes.items()
+        if (prior := scanned.get(slug)) is None or prior[0] is not note
+    ]
+    bodies = [index.notes[slug].body for slug in stale]
+    fresh = dict(zip(stale, _scan_notes(stale, bodies, parallel=parallel), strict=True))
+
     result = TodoIndex()
+    all_items: list[TodoItem] = []
+    by_note: dict[str, list[TodoItem]] = {}
     for slug, note in index.notes.items():
-        in_code_block = False
-        for line_no, line in enumerate(note.body.splitlines(), start=1):
-            # Toggle code-block tracking
-            if _SKIP_RE.match(line):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
-
-            stripped = line.strip()
-
-            # Pattern 1: markdown task item with TK
-            m = _TASK_TK_RE.match(stripped)
-            if m:
-                desc = (m.group(1) or "").strip() or stripped
-                result.items.append(TodoItem(slug, line_no, desc, line))
-                continue
-
-            # Pattern 2: "TK: description"
-            m = _COLON_TK_RE.match(stripped)
-            if m:
-                result.items.append(TodoItem(slug, line_no, m.group(1).strip(), line))
-                continue
-
-            # Pattern 3: bare TK anywhere on the line
-            if _BARE_TK_RE.search(stripped):
-                # Use the full line as description context
-                desc = stripped.replace("TK", "").strip(" -:").strip() or stripped
-                result.items.append(TodoItem(slug, line_no, desc, line))
-
+        items = fresh[slug] if slug in fresh else scanned[slug][1]
+        result._scanned[slug] = (note, items)
+        all_items.extend(items)
+        if items:
+            # A copy: append_item must not grow the list cached in _scanned
+            by_note[slug] = list(items)
+    result.items = all_items
+    result._by_note = (all_items, len(all_items), by_note)
     return result
 
 
+def _scan_notes(
+    slugs: list[str], bodies: list[str], *, parallel: bool = True
+) -> list[list[TodoItem]]:
+    """Scan each ``(slug, body)`` pair in order, using a process pool for large batches."""
+    if not parallel or len(slugs) < _PARALLEL_THRESHOLD:
+        return list(map(_scan_note, slugs, bodies))
+    workers = os.cpu_count() or 1
+    try:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # "spawn": forking a threaded host process (e.g. the marimo server) can deadlock
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            chunksize = max(1, len(slugs) // (workers * 4))
+            results = list(pool.map(_scan_note, slugs, bodies, chunksize=chunksize))
+        # Unpickled items carry private copies of their slug: share the caller's
+        for slug, items in zip(slugs, results, strict=True):
+            for item in items:
+                item.source_slug = slug
+        return results
+    except (ImportError, NotImplementedError, OSError):
+        # No subprocess support (e.g. Pyodide) — scan in-process instead
+        return list(map(_scan_note, slugs, bodies))
+
+
+def _skipped_spans(body: str) -> tuple[list[int], list[int]]:
+    """Return ``(starts, ends)`` of the fenced code blocks and HTML comments in *body*.
+
+    Spans are found in one left-to-right pass, so a fence inside a comment
+    (or a comment opener inside a fence) does not start a span of its own.
+    An unclosed span runs to the end of the body.
+    """
+    starts: list[int] = []
+    ends: list[int] = []
+    pos = 0
+    while (m := _SKIP_START_RE.search(body, pos)) is not None:
+        if m.group() == "<!--":
+            close = body.find("-->", m.end())
+            end = len(body) if close < 0 else close + 3
+        else:
+            close_fence = _FENCE_RE.search(body, m.end() + 1)
+            end = len(body) if close_fence is None else close_fence.end()
+        starts.append(m.start())
+        ends.append(end)
+        pos = max(end, m.end() + 1)
+    return starts, ends
+
+
+def _scan_note(slug: str, body: str) -> list[TodoItem]:
+    # Most notes have no marker at all: one search settles them without
+    # looking for fences or counting lines (and without a lower-cased copy)
+    if not _BARE_TK_RE.search(body):
+        return []
+    starts, ends = _skipped_spans(body)
+    items: list[TodoItem] = []
+    line_no = 1
+    pos = 0
+    line_end = -1
+    for tk in _BARE_TK_RE.finditer(body):
+        off = tk.start()
+        if off < line_end:
+            continue  # this line already produced its item
+        i = bisect_right(starts, off) - 1
+        if i >= 0 and off < ends[i]:
+            continue  # inside a fenced block or an HTML comment
+
+        line_start = body.rfind("\n", 0, off) + 1
+        line_end = body.find("\n", off)
+        if line_end < 0:
+            line_end = len(body)
+        line_no += body.count("\n", pos, line_start)
+        pos = line_start
+        line = body[line_start:line_end]
+        stripped = line.strip()
+
+        # Pattern 1: markdown task item with TK
+        m = _TASK_TK_RE.match(stripped)
+        if m:
+            desc = (m.group(1) or "").strip() or stripped
+            items.append(TodoItem(slug, line_no, desc, line))
+            continue
+
+        # Pattern 2: "TK: description"
+        m = _COLON_TK_RE.match(stripped)
+        if m:
+            items.append(TodoItem(slug, line_no, m.group(1).strip(), line))
+            continue
+
+        # Pattern 3: bare TK anywhere on the line
+        # Use the full line as description context
+        desc = stripped.replace("TK", "").strip(" -:").strip() or stripped
+        items.append(TodoItem(slug, line_no, desc, line))
+
+    return items
+
+
 # ---------------------------------------------------------------------------
 # Quick-capture
 # ---------------------------------------------------------------------------
 
+# Unchecked task box, e.g. "[ ]" (matched on the raw bytes of a line)
+_CHECKBOX_RE = re.compile(rb"\[\s*\]")
+# Written once when append_todo creates todos.md
+_TODOS_HEADER = (
+    "---\ntitle: Todos\ntags: [todos, meta]\n---\n\n# Todos\n\n"
+    "_Auto-generated by the vault TK quick-capture shorthand._\n\n"
+)
+
 
 def append_todo(vault_dir: Path, description: str, source_slug: str = "") -> None:
     """Append a new TK todo to ``vault/todos.md``, creating the file if absent.
@@ -144,28 +282,47 @@ def append_todo(vault_dir: Path, description: str, source_slug: str = "") -> Non
     todos_path = vault_dir / "todos.md"
     today = date.today().isoformat()
 
-    if not todos_path.exists():
-        todos_path.write_text(
-            "---\ntitle: Todos\ntags: [todos, meta]\n---\n\n# Todos\n\n"
-            "_Auto-generated by the vault TK quick-capture shorthand._\n\n",
-            encoding="utf-8",
-        )
-
     source = f" (from [[{source_slug}]])" if source_slug else ""
     line = f"- [ ] TK: {description}{source} — {today}\n"
 
+    # One append-mode open: an empty (just created) file gets the header first
     with todos_path.open("a", encoding="utf-8") as fh:
+        if fh.tell() == 0:
+            fh.write(_TODOS_HEADER)
         fh.write(line)
 
 
 def resolve_todo(vault_dir: Path, item: TodoItem) -> None:
-    """Mark a TK item as resolved by replacing ``- [ ]`` with ``- [x]`` in-place."""
+    """Mark a TK item as resolved by replacing ``- [ ]`` with ``- [x]`` in-place.
+
+    The file is read only up to the item's line; a plain ``[ ]`` checkbox is
+    overwritten with a single 3-byte write, anything else rewrites just the
+    remainder of the file.
+    """
     note_path = vault_dir / f"{item.source_slug}.md"
-    if not note_path.exists():
-        return
-    lines = note_path.read_text(encoding="utf-8").splitlines(keepends=True)
     idx = item.line_no - 1  # 0-based
-    if 0 <= idx < len(lines):
-        lines[idx] = re.sub(r"\[\s*\]", "[x]", lines[idx], count=1)
-        note_path.write_text("".join(lines), encoding="utf-8")
-        item.resolved = True
+    if idx < 0:
+        return
+    try:
+        fh = open(note_path, "r+b")
+    except FileNotFoundError:
+        return
+    with fh:
+        for _ in range(idx):
+            if not fh.readline():
+                return
+        start = fh.tell()
+        line = fh.readline()
+        if not line:
+            return
+        m = _CHECKBOX_RE.search(line)
+        if m is not None:
+            if m.end() - m.start() == 3:
+                fh.seek(start + m.start())
+                fh.write(b"[x]")
+            else:
+                rest = fh.read()
+                fh.seek(start)
+                fh.write(line[: m.start()] + b"[x]" + line[m.end() :] + rest)
+                fh.truncate()
+    item.resolved = True
@@ -0,0 +1,29 @@
+"""Fixtures shared by the vault and UI tests."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache_home(tmp_path_factory: pytest.TempPathFactory):
+    """Keep VaultIndex's persisted parse caches out of the real ``~/.cache``."""
+    previous = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path_factory.mktemp("cache_home"))
+    yield
+    if previous is None:
+        del os.environ["XDG_CACHE_HOME"]
+    else:
+        os.environ["XDG_CACHE_HOME"] = previous
+
+
+@pytest.fixture(scope="session")
+def empty_index(tmp_path_factory: pytest.TempPathFactory):
+    """A built VaultIndex over an empty directory (shared: do not mutate)."""
+    from vault.index import VaultIndex
+
+    idx = VaultIndex(tmp_path_factory.mktemp("empty_vault"))
+    idx.build()
+    return idx
@@ -1,70 +1,50 @@
-"""Shared fixtures for Playwright UI tests.
+"""Shared fixtures for the UI tests.
 
-Starts the Marimo vault app as a subprocess and provides a ``live_url``
-fixture that gives the base URL to each test.  The server is started once
-per session to keep test runs fast.
+``small_index`` is a two-note vault shared by the HTML builder tests; it is
+built once per session and must be treated as read-only.
+
+The browser tests live in ``e2e/``, whose conftest owns the Marimo server
+fixtures, so the HTML builder tests never start a subprocess.
 """
 
 from __future__ import annotations
 
-import subprocess
-import sys
-import time
+import textwrap
 from pathlib import Path
 
 import pytest
-import requests
 
-_ROOT = Path(__file__).parent.parent.parent
-_APP = _ROOT / "notebooks" / "vault_app.py"
-_PORT = 2718
 
+def _build_small_index(directory: Path):
+    """Write two notes linking to each other into *directory* and index them."""
+    from vault.index import VaultIndex
 
-@pytest.fixture(scope="session")
-def marimo_server():
-    """Start the marimo app server; yield the process; terminate on teardown."""
-    proc = subprocess.Popen(
-        [
-            sys.executable,
-            "-m",
-            "marimo",
-            "run",
-            str(_APP),
-            "--port",
-            str(_PORT),
-            "--headless",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        cwd=str(_ROOT),
+    (directory / "home.md").write_text(
+        textwrap.dedent("---\ntitle: Home\ntags: [x]\n---\nSee [[notes]].\n"),
+        encoding="utf-8",
+    )
+    (directory / "notes.md").write_text(
+        textwrap.dedent("---\ntitle: Notes\ntags: [todo]\n---\nBack to [[home]].\n"),
+        encoding="utf-8",
     )
+    idx = VaultIndex(directory)
+    idx.build()
+    return idx
 
-    # Wait up to 20 s for the server to be ready
-    deadline = time.time() + 20
-    while time.time() < deadline:
-        try:
-            r = requests.get(f"http://localhost:{_PORT}/", timeout=1)
-            if r.status_code < 500:
-                break
-        except Exception:
-            time.sleep(0.5)
-    else:
-        proc.terminate()
-        stdout, stderr = proc.communicate(timeout=5)
-        pytest.fail(
-            f"Marimo server did not start within 20 s.\n"
-            f"stdout: {stdout.decode()}\nstderr: {stderr.decode()}"
-        )
 
-    yield proc
+@pytest.fixture(scope="session")
+def small_index(tmp_path_factory: pytest.TempPathFactory):
+    """A tiny VaultIndex with two linked notes (shared: do not mutate)."""
+    return _build_small_index(tmp_path_factory.mktemp("small_vault"))
 
-    proc.terminate()
-    try:
-        proc.wait(timeout=5)
-    except subprocess.TimeoutExpired:
-        proc.kill()
 
+@pytest.fixture()
+def own_small_index(tmp_path: Path):
+    """Same vault as ``small_index``, but private to the test so it may be mutated."""
+    return _build_small_index(tmp_path)
 
-@pytest.fixture(scope="session")
-def live_url(marimo_server) -> str:  # noqa: ARG001
-    return f"http://localhost:{_PORT}"
+
+@pytest.fixture()
+def any_index(request: pytest.FixtureRequest):
+    """The index fixture named by an indirect ``parametrize`` value."""
+    return request.getfixturevalue(request.param)
@@ -0,0 +1,114 @@
+"""Fixtures for the browser end-to-end tests.
+
+Starts the Marimo vault app as a subprocess and provides a ``live_url``
+fixture that gives the base URL to each test.  The server is started once
+per session to keep test runs fast.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+_ROOT = Path(__file__).parent.parent.parent.parent
+_APP = _ROOT / "notebooks" / "vault_app.py"
+# Each pytest-xdist worker (gw0, gw1, ...) serves on its own port
+_PORT = 2718 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+# Persistent bytecode cache for the server process, so marimo and the vault
+# modules are compiled once rather than on every run; it lives in the
+# (git-ignored) pytest cache dir rather than the user's home
+_PYCACHE = Path(os.environ.get("PYTHONPYCACHEPREFIX", _ROOT / ".pytest_cache" / "marimo-pyc"))
+# Seconds to wait for the server; raise it on slow CI runners
+_STARTUP_TIMEOUT = float(os.environ.get("MARIMO_TEST_STARTUP_TIMEOUT", "20"))
+
+
+def _probe_session() -> requests.Session:
+    """A session holding one pooled connection, reused across readiness probes."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return session
+
+
+@pytest.fixture(scope="session")
+def marimo_server(tmp_path_factory: pytest.TempPathFactory):
+    """Start the marimo app server; yield the process; terminate on teardown.
+
+    Server output is discarded so an unread pipe can never fill up and stall
+    it; set ``MARIMO_TEST_LOGS=1`` to capture it in a log file instead.
+    """
+    log_path: Path | None = None
+    if os.environ.get("MARIMO_TEST_LOGS") == "1":
+        log_path = tmp_path_factory.mktemp("marimo") / "server.log"
+        output = log_path.open("wb")
+    else:
+        output = subprocess.DEVNULL
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "marimo",
+            "run",
+            str(_APP),
+            "--port",
+            str(_PORT),
+            "--headless",
+        ],
+        stdout=output,
+        stderr=subprocess.STDOUT,
+        cwd=str(_ROOT),
+        env={**os.environ, "PYTHONPYCACHEPREFIX": str(_PYCACHE)},
+    )
+
+    # Wait for the server to be ready: cheap TCP probes with exponential
+    # backoff, then HTTP requests on a pooled connection to confirm it serves pages
+    deadline = time.time() + _STARTUP_TIMEOUT
+    session = _probe_session()
+    delay = 0.01
+    ready = False
+    while time.time() < deadline and proc.poll() is None:
+        try:
+            socket.create_connection(("localhost", _PORT), timeout=0.05).close()
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+            continue
+        try:
+            if session.get(f"http://localhost:{_PORT}/", timeout=0.2).status_code < 500:
+                ready = True
+                break
+        except requests.RequestException:
+            pass
+        time.sleep(delay)
+    session.close()
+    if not ready:
+        proc.kill()
+        proc.wait()
+        if log_path is not None:
+            output.close()
+            logs = log_path.read_text(encoding="utf-8", errors="replace")
+        else:
+            logs = "(discarded; rerun with MARIMO_TEST_LOGS=1 to capture)"
+        pytest.fail(f"Marimo server did not start.\nlogs: {logs}")
+
+    yield proc
+
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    if log_path is not None:
+        output.close()
+
+
+@pytest.fixture(scope="session")
+def live_url(marimo_server) -> str:  # noqa: ARG001
+    return f"http://localhost:{_PORT}"
@@ -0,0 +1,174 @@
+"""Playwright end-to-end tests for the Marimo-Obsessed vault app.
+
+These tests require:
+  - ``playwright`` and ``pytest-playwright`` installed
+  - Playwright browsers installed (``uv run playwright install chromium``)
+  - The marimo server started via the ``live_url`` session fixture in this
+    directory's conftest.py
+
+Run with::
+
+    uv run pytest tests/test_ui/e2e -m e2e --browser chromium
+
+Tests are marked ``@pytest.mark.e2e`` so they can be skipped in fast CI runs::
+
+    uv run pytest -m "not e2e"
+"""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+# Skip (rather than error) at collection when Playwright is not installed
+expect = pytest.importorskip("playwright.sync_api").expect
+
+# One group keeps every e2e test on the worker running the single server
+pytestmark = [pytest.mark.e2e, pytest.mark.xdist_group("e2e")]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+# Upper bound for a reactive update to show up after an interaction
+_UI_TIMEOUT = 10_000
+
+
+def _wait_for_marimo(page, timeout: int = 15_000) -> None:
+    """Wait until the Marimo app shell is interactive."""
+    # Marimo renders a #root div once the Python kernel is ready
+    page.wait_for_selector("#root", timeout=timeout)
+    # The sidebar's "Notes" heading appears once the reactive cells have run
+    page.wait_for_selector("text=Notes", timeout=timeout)
+
+
+# Static assets the DOM assertions never look at
+_BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,woff,woff2,ttf,svg}"
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args):
+    return {**browser_context_args, "viewport": {"width": 1280, "height": 800}}
+
+
+@pytest.fixture(scope="session")
+def shared_context(browser, browser_context_args):
+    """One browser context for the whole run, with image and font requests aborted."""
+    context = browser.new_context(**browser_context_args)
+    context.route(_BLOCKED_ASSETS, lambda route: route.abort())
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="module")
+def live_page(shared_context, live_url):
+    """One page for the whole module, loaded and settled once.
+
+    Tests share it in order: a test that types into the search box clears it
+    before returning, and every test that depends on the active tab clicks
+    that tab first.  The selected note is not reset.
+    """
+    page = shared_context.new_page()
+    page.goto(live_url)
+    _wait_for_marimo(page)
+    yield page
+    page.close()
+
+
+# ---------------------------------------------------------------------------
+# App shell
+# ---------------------------------------------------------------------------
+
+
+class TestAppShell:
+    def test_page_loads(self, live_page):
+        page = live_page
+        assert "Marimo" in page.title() or page.locator("body").is_visible()
+
+    def test_sidebar_visible(self, live_page):
+        page = live_page
+        # Sidebar contains a "Notes" heading
+        assert page.locator("text=Notes").first.is_visible()
+
+    def test_tabs_present(self, live_page):
+        page = live_page
+        for tab_label in ("Graph", "Canvas", "Editor"):
+            assert page.locator(f"text={tab_label}").first.is_visible()
+
+
+# ---------------------------------------------------------------------------
+# Graph tab
+# ---------------------------------------------------------------------------
+
+
+class TestGraphTab:
+    def test_graph_tab_renders_svg(self, live_page):
+        """The Graph tab should render an Altair SVG/Canvas element."""
+        page = live_page
+        # Altair renders a <canvas> or <svg> element inside its output cell
+        page.locator("text=Graph").first.click()
+        expect(page.locator("canvas, svg").first).to_be_visible(timeout=_UI_TIMEOUT)
+
+    def test_sample_note_slug_in_graph(self, live_page):
+        """At least one vault note slug should appear in the graph tooltip data."""
+        page = live_page
+        page.locator("text=Graph").first.click()
+        page.locator("canvas, svg").first.wait_for(state="visible", timeout=_UI_TIMEOUT)
+        # Check the page source contains a known slug from the sample vault
+        content = page.content()
+        assert "index" in content or "getting-started" in content
+
+
+# ---------------------------------------------------------------------------
+# Canvas tab
+# ---------------------------------------------------------------------------
+
+
+class TestCanvasTab:
+    def test_canvas_tab_renders_iframe(self, live_page):
+        page = live_page
+        page.locator("text=Canvas").first.click()
+        expect(page.locator("iframe").first).to_be_visible(timeout=_UI_TIMEOUT)
+
+    def test_canvas_iframe_src_contains_tldraw(self, live_page):
+        page = live_page
+        page.locator("text=Canvas").first.click()
+        expect(page.locator("iframe").first).to_have_attribute(
+            "srcdoc", re.compile("tldraw", re.IGNORECASE), timeout=_UI_TIMEOUT
+        )
+
+
+# ---------------------------------------------------------------------------
+# Sidebar & editor
+# ---------------------------------------------------------------------------
+
+
+class TestSidebarNavigation:
+    def test_search_filters_notes(self, live_page):
+        page = live_page
+        # Type into the search input
+        search = page.locator("input[placeholder*='Search']").first
+        search.fill("getting")
+        try:
+            # "Getting Started" note should appear
+            expect(page.locator("text=Getting Started").first).to_be_visible(
+                timeout=_UI_TIMEOUT
+            )
+        finally:
+            search.fill("")
+            expect(search).to_have_value("")
+
+    def test_clicking_note_switches_to_editor(self, live_page):
+        page = live_page
+        # Click first note button in the sidebar
+        page.locator("text=Getting Started").first.click()
+        # Editor tab should now be active; the note title should appear
+        expect(page.locator("text=Getting Started").first).to_be_visible(timeout=_UI_TIMEOUT)
+
+    def test_tag_filter_dropdown_visible(self, live_page):
+        page = live_page
+        # Tag dropdown should exist
+        expect(page.locator("select, [role='combobox']").first).to_be_visible()
@@ -7,118 +7,123 @@ needing a live Playwright browser.
 
 from __future__ import annotations
 
-import textwrap
-from pathlib import Path
+import gc
+import weakref
 
 import pytest
 
+from vault.canvas import (
+    build_canvas_html,
+    build_tldraw_snapshot,
+    canvas_state_to_dict,
+    create_plugin,
+    dict_to_canvas,
+)
 
-@pytest.fixture()
-def small_index(tmp_path: Path):
-    from vault.index import VaultIndex
 
-    (tmp_path / "home.md").write_text(
-        textwrap.dedent("---\ntitle: Home\n---\nSee [[notes]].\n"),
-        encoding="utf-8",
-    )
-    (tmp_path / "notes.md").write_text(
-        textwrap.dedent("---\ntitle: Notes\ntags: [todo]\n---\nBack to [[home]].\n"),
-        encoding="utf-8",
-    )
-    idx = VaultIndex(tmp_path)
-    idx.build()
-    return idx
+@pytest.fixture(scope="class")
+def snapshot(small_index):
+    return build_tldraw_snapshot(small_index)
 
 
-class TestBuildTldrawSnapshot:
-    def test_returns_dict_with_store(self, small_index):
-        from vault.canvas import build_tldraw_snapshot
-
-        snap = build_tldraw_snapshot(small_index)
-        assert "store" in snap
-        assert "schema" in snap
+@pytest.fixture(scope="class")
+def categorized(snapshot) -> dict:
+    """Snapshot records bucketed by kind in a single pass over the store."""
+    buckets: dict = {"page": [], "geo": [], "arrow": [], "geo_slugs": set()}
+    for r in snapshot["store"].values():
+        if r.get("typeName") == "page":
+            buckets["page"].append(r)
+        kind = r.get("type")
+        if kind == "geo":
+            buckets["geo"].append(r)
+            buckets["geo_slugs"].add(r["meta"]["slug"])
+        elif kind == "arrow":
+            buckets["arrow"].append(r)
+    return buckets
 
-    def test_contains_page(self, small_index):
-        from vault.canvas import build_tldraw_snapshot
 
-        snap = build_tldraw_snapshot(small_index)
-        records = list(snap["store"].values())
-        page_records = [r for r in records if r.get("typeName") == "page"]
-        assert len(page_records) == 1
+class TestBuildTldrawSnapshot:
+    def test_returns_dict_with_store(self, snapshot):
+        assert "store" in snapshot
+        assert "schema" in snapshot
 
-    def test_contains_note_shapes(self, small_index):
-        from vault.canvas import build_tldraw_snapshot
+    def test_contains_page(self, categorized):
+        assert len(categorized["page"]) == 1
 
-        snap = build_tldraw_snapshot(small_index)
-        records = list(snap["store"].values())
-        geo_shapes = [r for r in records if r.get("type") == "geo"]
+    def test_contains_note_shapes(self, small_index, categorized):
         # One shape per note
-        assert len(geo_shapes) == len(small_index.notes)
+        assert len(categorized["geo"]) == len(small_index.notes)
 
-    def test_contains_arrow_for_link(self, small_index):
-        from vault.canvas import build_tldraw_snapshot
-
-        snap = build_tldraw_snapshot(small_index)
-        records = list(snap["store"].values())
-        arrow_shapes = [r for r in records if r.get("type") == "arrow"]
+    def test_contains_arrow_for_link(self, categorized):
         # Two bi-directional links (home→notes, notes→home)
-        assert len(arrow_shapes) >= 1
+        assert len(categorized["arrow"]) >= 1
 
-    def test_shape_slugs_in_meta(self, small_index):
-        from vault.canvas import build_tldraw_snapshot
+    def test_shape_slugs_in_meta(self, small_index, categorized):
+        assert categorized["geo_slugs"] == set(small_index.notes.keys())
 
-        snap = build_tldraw_snapshot(small_index)
-        records = list(snap["store"].values())
-        geo_slugs = {r["meta"]["slug"] for r in records if r.get("type") == "geo"}
-        assert geo_slugs == set(small_index.notes.keys())
-
-    def test_empty_index(self, tmp_path: Path):
-        from vault.canvas import build_tldraw_snapshot
-        from vault.index import VaultIndex
+    def test_shape_ids_are_deterministic(self, small_index):
+        first = build_tldraw_snapshot(small_index)
+        assert first == build_tldraw_snapshot(small_index)
+        shape_ids = [k for k in first["store"] if k.startswith("shape:")]
+        assert len(shape_ids) == len(set(shape_ids))
 
-        idx = VaultIndex(tmp_path)
-        idx.build()
-        snap = build_tldraw_snapshot(idx)
-        # Only the page record should be present
-        assert len(snap["store"]) == 1
+    @pytest.mark.parametrize("any_index", ["small_index", "empty_index"], indirect=True)
+    def test_one_page_and_one_shape_per_note(self, any_index):
+        records = build_tldraw_snapshot(any_index)["store"].values()
+        assert sum(r.get("typeName") == "page" for r in records) == 1
+        assert sum(r.get("type") == "geo" for r in records) == len(any_index.notes)
 
 
 class TestBuildCanvasHtml:
     def test_returns_iframe_string(self, small_index):
-        from vault.canvas import build_canvas_html
-
         html = build_canvas_html(small_index)
         assert "<iframe" in html
         assert "srcdoc=" in html
 
     def test_contains_tldraw_import(self, small_index):
-        from vault.canvas import build_canvas_html
-
         html = build_canvas_html(small_index)
         assert "tldraw" in html.lower()
 
     def test_snapshot_json_embedded(self, small_index):
-        from vault.canvas import build_canvas_html, build_tldraw_snapshot
-
         snap = build_tldraw_snapshot(small_index)
         html = build_canvas_html(small_index, snapshot=snap)
         # The page id should be encoded in the HTML
         assert "page:main" in html
 
     def test_custom_height(self, small_index):
-        from vault.canvas import build_canvas_html
-
         html = build_canvas_html(small_index, height="800px")
         assert "800px" in html
 
-    def test_roundtrip_serialisation(self, small_index):
-        from vault.canvas import (
-            build_tldraw_snapshot,
-            canvas_state_to_dict,
-            dict_to_canvas,
-        )
+    def test_cached_until_index_changes(self, own_small_index):
+        html = build_canvas_html(own_small_index)
+        assert build_canvas_html(own_small_index) is html
+        own_small_index.version += 1
+        assert build_canvas_html(own_small_index) is not html
 
+    def test_cache_does_not_keep_index_alive(self, tmp_path):
+        from vault.index import VaultIndex
+
+        index = VaultIndex(tmp_path, persist_cache=False)
+        index.build()
+        build_canvas_html(index)
+        ref = weakref.ref(index)
+        del index
+        gc.collect()
+        assert ref() is None
+
+    def test_roundtrip_serialisation(self, small_index):
         original = build_tldraw_snapshot(small_index)
         serialised = canvas_state_to_dict(original)
         restored = dict_to_canvas(serialised)
         assert restored == original
+
+
+class TestCanvasPlugin:
+    def test_render_reuses_html_until_index_update(self, small_index):
+        plugin = create_plugin(descriptor=None)
+        plugin.on_load(small_index)
+        html = plugin.render()
+        assert plugin.render() is html
+        plugin.on_index_update(small_index)
+        assert plugin._html_cache is None
+        assert plugin.render() == html
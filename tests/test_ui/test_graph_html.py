@@ -6,78 +6,75 @@ structurally valid Altair chart without needing a live Playwright browser.
 
 from __future__ import annotations
 
-import textwrap
-from pathlib import Path
+import gc
+import weakref
 
+import altair as alt
 import pytest
 
+from vault.graph import build_graph_spec, create_plugin
 
-@pytest.fixture()
-def small_index(tmp_path: Path):
-    """A tiny VaultIndex with two linked notes."""
-    from vault.index import VaultIndex
 
-    (tmp_path / "a.md").write_text(
-        textwrap.dedent("---\ntitle: Note A\ntags: [x]\n---\nSee [[b]].\n"),
-        encoding="utf-8",
-    )
-    (tmp_path / "b.md").write_text(
-        textwrap.dedent("---\ntitle: Note B\n---\nLinks to [[a]].\n"),
-        encoding="utf-8",
-    )
-    idx = VaultIndex(tmp_path)
-    idx.build()
-    return idx
+@pytest.fixture(scope="class")
+def spec_str(small_index) -> str:
+    """Vega-Lite spec of the small vault's graph, highlighting ``home``, as text.
 
+    ``repr`` of the unvalidated dict is enough for substring checks and skips
+    Altair's schema validation and JSON encoding.
+    """
+    return repr(build_graph_spec(small_index, highlight="home").to_dict(validate=False))
 
-class TestBuildGraphSpec:
-    def test_returns_altair_chart(self, small_index):
-        import altair as alt
-
-        from vault.graph import build_graph_spec
 
-        chart = build_graph_spec(small_index)
+class TestBuildGraphSpec:
+    @pytest.mark.parametrize("any_index", ["small_index", "empty_index"], indirect=True)
+    def test_returns_altair_chart(self, any_index):
+        # An empty index must not raise even with no nodes/edges
+        chart = build_graph_spec(any_index)
         assert isinstance(chart, alt.LayerChart)
 
-    def test_chart_json_contains_node_slugs(self, small_index):
-        import json
-
-        from vault.graph import build_graph_spec
-
-        chart = build_graph_spec(small_index)
-        spec = json.loads(chart.to_json())
-        spec_str = json.dumps(spec)
-        assert "a" in spec_str
-        assert "b" in spec_str
+    def test_chart_json_contains_node_slugs(self, spec_str: str):
+        assert "home" in spec_str
+        assert "notes" in spec_str
 
-    def test_highlight_reflected_in_data(self, small_index):
-        import json
-
-        from vault.graph import build_graph_spec
-
-        chart = build_graph_spec(small_index, highlight="a")
-        spec_str = json.dumps(json.loads(chart.to_json()))
+    def test_highlight_reflected_in_data(self, spec_str: str):
         # The highlighted field should appear in at least one dataset
         assert "highlighted" in spec_str
 
-    def test_empty_index_does_not_raise(self, tmp_path: Path):
-        from vault.graph import build_graph_spec
-        from vault.index import VaultIndex
-
-        idx = VaultIndex(tmp_path)
-        idx.build()
-        # Should not raise even with no nodes/edges
-
-        build_graph_spec(idx)
-
     def test_custom_dimensions(self, small_index):
-        import json
-
-        from vault.graph import build_graph_spec
-
         chart = build_graph_spec(small_index, width=800, height=400)
-        spec = json.loads(chart.to_json())
+        spec_str = repr(chart.to_dict(validate=False))
         # width/height should appear somewhere in the vega-lite spec
-        spec_str = json.dumps(spec)
         assert "800" in spec_str
         assert "400" in spec_str
+
+    def test_highlight_change_reuses_layout(self, small_index):
+        first = build_graph_spec(small_index, highlight="a").to_dict(validate=False)
+        second = build_graph_spec(small_index, highlight="b").to_dict(validate=False)
+        assert first["params"] == [{"name": "highlighted", "value": "a"}]
+        assert second["params"] == [{"name": "highlighted", "value": "b"}]
+        assert first["layer"] == second["layer"]
+
+    def test_no_highlight_matches_no_slug(self, empty_index):
+        # The empty graph's placeholder node has slug ""
+        spec = build_graph_spec(empty_index).to_dict(validate=False)
+        assert spec["params"] == [{"name": "highlighted", "value": None}]
+
+    def test_cache_does_not_keep_index_alive(self, tmp_path):
+        from vault.index import VaultIndex
+
+        index = VaultIndex(tmp_path, persist_cache=False)
+        index.build()
+        build_graph_spec(index)
+        ref = weakref.ref(index)
+        del index
+        gc.collect()
+        assert ref() is None
+
+
+class TestGraphViewPlugin:
+    def test_render_reuses_chart_for_same_highlight(self, small_index):
+        plugin = create_plugin(descriptor=None)
+        plugin.on_load(small_index)
+        chart = plugin.render(highlight="a")
+        assert plugin.render(highlight="a") is chart
+        assert plugin.render(highlight="b") is not chart
@@ -7,7 +7,7 @@ import duckdb
 import polars as pl
 import pytest
 
-from vault.db import VaultDB
+from vault.db import _VIEW_CACHE_SIZE, VaultDB
 from vault.index import VaultIndex
 
 # ---------------------------------------------------------------------------
@@ -15,39 +15,64 @@ from vault.index import VaultIndex
 # ---------------------------------------------------------------------------
 
 
-def _write(directory: Path, name: str, content: str) -> None:
-    (directory / f"{name}.md").write_text(textwrap.dedent(content), encoding="utf-8")
+# Sample notes, dedented and encoded once at import
+_ALPHA = textwrap.dedent("""\
+    ---
+    title: Alpha
+    tags: [python, tutorial]
+    status: done
+    ---
+    See [[beta]].
+""").encode("utf-8")
+_BETA = textwrap.dedent("""\
+    ---
+    title: Beta
+    tags: [python]
+    status: in-progress
+    ---
+    Links [[alpha]].
+""").encode("utf-8")
+_GAMMA = textwrap.dedent("""\
+    ---
+    title: Gamma
+    tags: [data]
+    status: done
+    ---
+    No links here.
+""").encode("utf-8")
+
+
+def _write(directory: Path, name: str, data: bytes) -> None:
+    (directory / f"{name}.md").write_bytes(data)
+
+
+def _write_sample_vault(directory: Path) -> None:
+    _write(directory, "alpha", _ALPHA)
+    _write(directory, "beta", _BETA)
+    _write(directory, "gamma", _GAMMA)
+
+
+@pytest.fixture(scope="module")
+def sample_index(tmp_path_factory: pytest.TempPathFactory) -> VaultIndex:
+    """The three-note sample vault, built once per module (do not mutate)."""
+    directory = tmp_path_factory.mktemp("db_vault")
+    _write_sample_vault(directory)
+    idx = VaultIndex(directory)
+    idx.build()
+    return idx
+
+
+@pytest.fixture(scope="module")
+def db(sample_index: VaultIndex):
+    """One VaultDB over the sample vault for the read-only tests (do not refresh)."""
+    with VaultDB(sample_index) as d:
+        yield d
 
 
 @pytest.fixture()
-def db(tmp_path: Path) -> VaultDB:
-    _write(tmp_path, "alpha", """\
-        ---
-        title: Alpha
-        tags: [python, tutorial]
-        status: done
-        ---
-        See [[beta]].
-    """)
-    _write(tmp_path, "beta", """\
-        ---
-        title: Beta
-        tags: [python]
-        status: in-progress
-        ---
-        Links [[alpha]].
-    """)
-    _write(tmp_path, "gamma", """\
-        ---
-        title: Gamma
-        tags: [data]
-        status: done
-        ---
-        No links here.
-    """)
-    idx = VaultIndex(tmp_path)
-    idx.build()
-    return VaultDB(idx)
+def own_db(sample_index: VaultIndex) -> VaultDB:
+    """A VaultDB private to the test, for tests that refresh it."""
+    return VaultDB(sample_index)
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +97,14 @@ class TestVaultDBQuery:
         with pytest.raises(duckdb.Error):
             db.query("SELECT * FROM nonexistent_table")
 
+    def test_non_string_title_and_tags(self, tmp_path: Path):
+        _write(tmp_path, "log", b"---\ntitle: 1984\ntags: [2024, x]\n---\nDone.\n")
+        idx = VaultIndex(tmp_path)
+        idx.build()
+        with VaultDB(idx) as d:
+            row = d.query("SELECT title, tags FROM notes").row(0)
+        assert row == ("1984", ["2024", "x"])
+
 
 # ---------------------------------------------------------------------------
 # table_view()
@@ -113,6 +146,41 @@ class TestTableView:
         assert len(df) == 1
         assert df["slug"][0] == "gamma"
 
+    def test_search_is_literal(self, db: VaultDB):
+        assert len(db.table_view(search="G.mma")) == 0
+
+    def test_frontmatter_column(self, db: VaultDB):
+        df = db.table_view(columns=["slug", "frontmatter"], order_by="slug")
+        assert list(df.columns) == ["slug", "frontmatter"]
+        assert list(df["slug"]) == ["alpha", "beta", "gamma"]
+
+    def test_sql_expression_order_by(self, db: VaultDB):
+        df = db.table_view(order_by="length(title) DESC, slug")
+        assert list(df["slug"]) == ["alpha", "gamma", "beta"]
+
+    def test_sql_path_search_is_literal(self, db: VaultDB):
+        assert len(db.table_view(search="%", order_by="title DESC")) == 0
+        assert len(db.table_view(search="gamma", order_by="title DESC")) == 1
+
+    def test_unknown_column_rejected(self, db: VaultDB):
+        with pytest.raises(ValueError):
+            db.table_view(columns=["slug", "1; DROP TABLE notes"], order_by="title DESC")
+
+    def test_repeated_filter_is_memoised(self, db: VaultDB):
+        assert db.table_view(filter_tag="python") is db.table_view(filter_tag="python")
+
+    def test_refresh_clears_memoised_views(self, own_db: VaultDB):
+        before = own_db.table_view()
+        own_db.refresh(own_db._index)
+        assert own_db.table_view() is not before
+
+    def test_memoised_views_are_bounded(self, own_db: VaultDB):
+        first = own_db.table_view(search="q0")
+        for i in range(1, _VIEW_CACHE_SIZE + 1):
+            own_db.table_view(search=f"q{i}")
+        assert len(own_db._view_cache) == _VIEW_CACHE_SIZE
+        assert own_db.table_view(search="q0") is not first
+
 
 # ---------------------------------------------------------------------------
 # kanban_view()
@@ -134,13 +202,25 @@ class TestKanbanView:
         assert len(groups["in-progress"]) == 1
 
     def test_missing_key_grouped_as_none(self, tmp_path: Path):
-        _write(tmp_path, "no-status.md", "---\ntitle: No Status\ntags: []\n---\nBody.\n")
+        _write(tmp_path, "no-status.md", b"---\ntitle: No Status\ntags: []\n---\nBody.\n")
         idx = VaultIndex(tmp_path)
         idx.build()
         d = VaultDB(idx)
         groups = d.kanban_view(group_by="status")
         assert "(none)" in groups
 
+    def test_non_string_values_grouped_as_json_text(self, tmp_path: Path):
+        _write(tmp_path, "a.md", b"---\npriority: 2\ndraft: true\n---\nBody.\n")
+        idx = VaultIndex(tmp_path)
+        idx.build()
+        d = VaultDB(idx)
+        assert list(d.kanban_view(group_by="priority")) == ["2"]
+        assert list(d.kanban_view(group_by="draft")) == ["true"]
+
+    def test_quoted_key_is_not_injected(self, db: VaultDB):
+        groups = db.kanban_view(group_by="status') OR 1=1 --")
+        assert list(groups) == ["(none)"]
+
 
 # ---------------------------------------------------------------------------
 # gallery_view()
@@ -179,6 +259,12 @@ class TestTagCounts:
         counts = list(df["note_count"])
         assert counts == sorted(counts, reverse=True)
 
+    def test_memoised_until_refresh(self, own_db: VaultDB):
+        df = own_db.tag_counts()
+        assert own_db.tag_counts() is df
+        own_db.refresh(own_db._index)
+        assert own_db.tag_counts() is not df
+
 
 # ---------------------------------------------------------------------------
 # frontmatter_keys()
@@ -196,12 +282,16 @@ class TestFrontmatterKeys:
         # frontmatter_keys only returns keys inside the JSON frontmatter column
         assert isinstance(keys, list)
 
-    def test_empty_vault(self, tmp_path: Path):
+    def test_empty_vault(self, empty_index: VaultIndex):
+        with VaultDB(empty_index) as d:
+            assert d.frontmatter_keys() == []
+
+    def test_date_values_are_serialised(self, tmp_path: Path):
+        _write(tmp_path, "dated", b"---\ncreated: 2024-01-02\n---\nBody.\n")
         idx = VaultIndex(tmp_path)
         idx.build()
         d = VaultDB(idx)
-        keys = d.frontmatter_keys()
-        assert keys == []
+        assert d.frontmatter_keys() == ["created"]
 
 
 # ---------------------------------------------------------------------------
@@ -210,11 +300,15 @@ class TestFrontmatterKeys:
 
 
 class TestRefresh:
-    def test_refresh_picks_up_new_note(self, db: VaultDB, tmp_path: Path):
-        _write(tmp_path, "delta", "---\ntitle: Delta\ntags: [new]\n---\nBody.\n")
-        new_idx = VaultIndex(tmp_path)
-        new_idx.build()
-        db.refresh(new_idx)
+    def test_refresh_picks_up_new_note(self, tmp_path: Path):
+        _write_sample_vault(tmp_path)
+        idx = VaultIndex(tmp_path)
+        idx.build()
+        db = VaultDB(idx)
+        _write(tmp_path, "delta", b"---\ntitle: Delta\ntags: [new]\n---\nBody.\n")
+        # build() is incremental: only the new file is parsed
+        idx.build()
+        db.refresh(idx)
         df = db.query("SELECT slug FROM notes WHERE slug = 'delta'")
         assert len(df) == 1
 
@@ -225,8 +319,6 @@ class TestRefresh:
 
 
 class TestContextManager:
-    def test_context_manager(self, tmp_path: Path):
-        idx = VaultIndex(tmp_path)
-        idx.build()
-        with VaultDB(idx) as d:
+    def test_context_manager(self, empty_index: VaultIndex):
+        with VaultDB(empty_index) as d:
             assert d.query("SELECT 1 AS x")["x"][0] == 1
@@ -5,44 +5,64 @@ from pathlib import Path
 
 import pytest
 
-from vault.index import VaultIndex
-
-
-def _write_note(directory: Path, name: str, content: str) -> Path:
+from vault.index import VaultIndex, _cache_path
+
+# Fixture notes, dedented and encoded once at import
+_ALPHA = textwrap.dedent("""\
+    ---
+    title: Alpha
+    tags: [first]
+    ---
+    See [[beta]] and [[gamma]].
+""").encode("utf-8")
+_BETA = textwrap.dedent("""\
+    ---
+    title: Beta
+    tags: [second]
+    ---
+    Links back to [[alpha]].
+""").encode("utf-8")
+_GAMMA = textwrap.dedent("""\
+    ---
+    title: Gamma
+    tags: [first, second]
+    ---
+    Standalone note. #extra
+""").encode("utf-8")
+
+
+def _write_note(directory: Path, name: str, data: bytes) -> Path:
     path = directory / f"{name}.md"
-    path.write_text(textwrap.dedent(content), encoding="utf-8")
+    path.write_bytes(data)
     return path
 
 
-@pytest.fixture()
-def vault(tmp_path: Path) -> VaultIndex:
-    """Minimal vault fixture with three inter-linked notes."""
-    _write_note(tmp_path, "alpha", """\
-        ---
-        title: Alpha
-        tags: [first]
-        ---
-        See [[beta]] and [[gamma]].
-    """)
-    _write_note(tmp_path, "beta", """\
-        ---
-        title: Beta
-        tags: [second]
-        ---
-        Links back to [[alpha]].
-    """)
-    _write_note(tmp_path, "gamma", """\
-        ---
-        title: Gamma
-        tags: [first, second]
-        ---
-        Standalone note. #extra
-    """)
-    idx = VaultIndex(tmp_path)
+def _build_vault(directory: Path) -> VaultIndex:
+    _write_note(directory, "alpha", _ALPHA)
+    _write_note(directory, "beta", _BETA)
+    _write_note(directory, "gamma", _GAMMA)
+    idx = VaultIndex(directory)
     idx.build()
     return idx
 
 
+@pytest.fixture(scope="module")
+def vault(tmp_path_factory: pytest.TempPathFactory) -> VaultIndex:
+    """Minimal vault with three inter-linked notes, built once (do not mutate)."""
+    return _build_vault(tmp_path_factory.mktemp("index_vault"))
+
+
+@pytest.fixture()
+def own_vault(tmp_path: Path) -> VaultIndex:
+    """Same vault as ``vault``, but private to the test so it may be rebuilt or edited."""
+    return _build_vault(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def edges(vault: VaultIndex) -> list[tuple[str, str]]:
+    return vault.edges()
+
+
 # ---------------------------------------------------------------------------
 # Notes
 # ---------------------------------------------------------------------------
@@ -74,10 +94,22 @@ class TestVaultIndexBacklinks:
     def test_gamma_is_linked_by_alpha(self, vault: VaultIndex):
         assert "alpha" in vault.backlinks.get("gamma", [])
 
+    def test_backlinks_are_frozen(self, vault: VaultIndex):
+        assert all(isinstance(v, tuple) for v in vault.backlinks.values())
+        assert all(isinstance(v, tuple) for v in vault.tags.values())
+
     def test_no_duplicate_backlinks(self, vault: VaultIndex):
         for sources in vault.backlinks.values():
             assert len(sources) == len(set(sources))
 
+    def test_backlinks_rendered_rows_and_markdown(self, vault: VaultIndex):
+        from vault.backlinks import backlinks_panel_ui
+
+        rows = backlinks_panel_ui(vault, "gamma")
+        assert rows == [{"slug": "alpha", "title": vault.notes["alpha"].title}]
+        assert vault.backlinks_md["gamma"] == f"- **{rows[0]['title']}** (`alpha`)"
+        assert backlinks_panel_ui(vault, "nonexistent") == []
+
 
 # ---------------------------------------------------------------------------
 # Edges
@@ -85,17 +117,20 @@ class TestVaultIndexBacklinks:
 
 
 class TestVaultIndexEdges:
-    def test_edges_contain_alpha_to_beta(self, vault: VaultIndex):
-        assert ("alpha", "beta") in vault.edges()
+    def test_edges_contain_alpha_to_beta(self, edges: list[tuple[str, str]]):
+        assert ("alpha", "beta") in edges
+
+    def test_edges_contain_alpha_to_gamma(self, edges: list[tuple[str, str]]):
+        assert ("alpha", "gamma") in edges
 
-    def test_edges_contain_alpha_to_gamma(self, vault: VaultIndex):
-        assert ("alpha", "gamma") in vault.edges()
+    def test_edges_contain_beta_to_alpha(self, edges: list[tuple[str, str]]):
+        assert ("beta", "alpha") in edges
 
-    def test_edges_contain_beta_to_alpha(self, vault: VaultIndex):
-        assert ("beta", "alpha") in vault.edges()
+    def test_edges_returns_list(self, edges: list[tuple[str, str]]):
+        assert isinstance(edges, list)
 
-    def test_edges_returns_list(self, vault: VaultIndex):
-        assert isinstance(vault.edges(), list)
+    def test_iter_edges_matches_edges(self, vault: VaultIndex, edges: list[tuple[str, str]]):
+        assert list(vault.iter_edges()) == edges
 
 
 # ---------------------------------------------------------------------------
@@ -118,6 +153,15 @@ class TestVaultIndexTags:
         slugs = {n.slug for n in notes}
         assert slugs == {"beta", "gamma"}
 
+    def test_notes_with_tag_sorted_by_title(self, vault: VaultIndex):
+        assert [n.title for n in vault.notes_with_tag("first")] == ["Alpha", "Gamma"]
+
+    def test_notes_sorted_by_title(self, vault: VaultIndex):
+        assert [n.title for n in vault.notes_sorted] == ["Alpha", "Beta", "Gamma"]
+
+    def test_tag_options_sorted(self, vault: VaultIndex):
+        assert vault.tag_options_sorted == tuple(sorted(vault.tags))
+
 
 # ---------------------------------------------------------------------------
 # Search
@@ -141,9 +185,20 @@ class TestVaultIndexSearch:
         results = vault.search("zzz_no_match_zzz")
         assert results == []
 
-    def test_empty_vault(self, tmp_path: Path):
-        idx = VaultIndex(tmp_path)
-        idx.build()
+    def test_search_word_prefix(self, vault: VaultIndex):
+        results = vault.search("stand")
+        assert [n.slug for n in results] == ["gamma"]
+
+    def test_search_all_words_must_match(self, vault: VaultIndex):
+        assert [n.slug for n in vault.search("links back")] == ["beta"]
+        assert vault.search("links standalone") == []
+
+    def test_search_punctuation_falls_back_to_substring(self, vault: VaultIndex):
+        results = vault.search("[[")
+        assert {n.slug for n in results} == {"alpha", "beta"}
+
+    def test_empty_vault(self, empty_index: VaultIndex):
+        idx = empty_index
         assert idx.notes == {}
         assert idx.edges() == []
         assert idx.search("anything") == []
@@ -160,6 +215,113 @@ class TestVaultIndexRebuild:
         idx.build()
         assert "delta" not in idx.notes
 
-        _write_note(tmp_path, "delta", "---\ntitle: Delta\n---\nHello.\n")
+        _write_note(tmp_path, "delta", b"---\ntitle: Delta\n---\nHello.\n")
         idx.build()
         assert "delta" in idx.notes
+
+    def test_build_finds_notes_in_subdirectories(self, tmp_path: Path):
+        (tmp_path / "nested" / "deeper").mkdir(parents=True)
+        _write_note(tmp_path / "nested" / "deeper", "epsilon", b"---\ntitle: Epsilon\n---\nHi.\n")
+        (tmp_path / "nested" / "notes.txt").write_text("not markdown", encoding="utf-8")
+        idx = VaultIndex(tmp_path)
+        idx.build()
+        assert set(idx.notes) == {"epsilon"}
+
+    def test_numeric_title(self, tmp_path: Path):
+        # YAML reads ``title: 1984`` as an int
+        _write_note(tmp_path, "orwell", b"---\ntitle: 1984\n---\nBig brother.\n")
+        _write_note(tmp_path, "huxley", b"---\ntitle: Brave\n---\nSoma.\n")
+        idx = VaultIndex(tmp_path, persist_cache=False)
+        idx.build()
+        assert [n.slug for n in idx.notes_sorted] == ["orwell", "huxley"]
+        assert [n.slug for n in idx.search("!")] == []
+
+    def test_numeric_tag(self, tmp_path: Path):
+        _write_note(tmp_path, "log", b"---\ntitle: Log\ntags: [2024, x]\n---\nDone.\n")
+        idx = VaultIndex(tmp_path, persist_cache=False)
+        idx.build()
+        assert idx.tag_options_sorted == (2024, "x")
+
+
+# ---------------------------------------------------------------------------
+# Incremental build
+# ---------------------------------------------------------------------------
+
+
+class TestVaultIndexIncremental:
+    def test_unchanged_note_is_reused(self, own_vault: VaultIndex):
+        before = own_vault.notes["alpha"]
+        own_vault.build()
+        assert own_vault.notes["alpha"] is before
+
+    def test_changed_note_is_reparsed(self, own_vault: VaultIndex):
+        _write_note(
+            own_vault.vault_dir, "alpha", b"---\ntitle: Alpha Prime\n---\nNo links any more.\n"
+        )
+        own_vault.build()
+        assert own_vault.notes["alpha"].title == "Alpha Prime"
+        assert "alpha" not in own_vault.backlinks.get("beta", [])
+
+    def test_deleted_note_is_dropped(self, own_vault: VaultIndex):
+        (own_vault.vault_dir / "gamma.md").unlink()
+        own_vault.build()
+        assert "gamma" not in own_vault.notes
+        assert "gamma" not in own_vault.tags.get("first", [])
+
+    def test_version_bumps_only_on_change(self, own_vault: VaultIndex):
+        version = own_vault.version
+        own_vault.build()
+        assert own_vault.version == version
+        _write_note(own_vault.vault_dir, "delta", b"New note.\n")
+        own_vault.build()
+        assert own_vault.version == version + 1
+
+    def test_parallel_parse_matches_serial(
+        self, own_vault: VaultIndex, monkeypatch: pytest.MonkeyPatch
+    ):
+        import vault.index as index_module
+
+        monkeypatch.setattr(index_module, "_PARALLEL_THRESHOLD", 1)
+        fresh = VaultIndex(own_vault.vault_dir, persist_cache=False)
+        fresh.build()
+        assert fresh.notes == own_vault.notes
+
+    def test_parallel_disabled_parses_serially(
+        self, own_vault: VaultIndex, monkeypatch: pytest.MonkeyPatch
+    ):
+        import vault.index as index_module
+
+        monkeypatch.setattr(index_module, "_PARALLEL_THRESHOLD", 1)
+        monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", None)
+        serial = VaultIndex(own_vault.vault_dir, persist_cache=False, parallel=False)
+        serial.build()
+        assert serial.notes == own_vault.notes
+
+    def test_optimize_reparses_everything(self, own_vault: VaultIndex):
+        before = own_vault.notes["alpha"]
+        own_vault.optimize()
+        assert own_vault.notes["alpha"] is not before
+        assert own_vault.notes["alpha"].title == "Alpha"
+
+    def test_cache_persists_across_instances(self, own_vault: VaultIndex):
+        fresh = VaultIndex(own_vault.vault_dir)
+        fresh.build()
+        assert fresh._fingerprints == own_vault._fingerprints
+        assert set(fresh.notes) == {"alpha", "beta", "gamma"}
+
+    def test_cache_is_kept_outside_the_vault(self, own_vault: VaultIndex):
+        assert _cache_path(own_vault.vault_dir).exists()
+        assert not _cache_path(own_vault.vault_dir).is_relative_to(own_vault.vault_dir)
+        assert [p.name for p in own_vault.vault_dir.iterdir() if p.suffix != ".md"] == []
+
+    def test_corrupt_cache_is_ignored(self, own_vault: VaultIndex):
+        _cache_path(own_vault.vault_dir).write_bytes(b"not a pickle")
+        fresh = VaultIndex(own_vault.vault_dir)
+        fresh.build()
+        assert set(fresh.notes) == {"alpha", "beta", "gamma"}
+
+    def test_persist_cache_disabled(self, tmp_path: Path):
+        _write_note(tmp_path, "solo", b"Hello.\n")
+        idx = VaultIndex(tmp_path, persist_cache=False)
+        idx.build()
+        assert not _cache_path(tmp_path).exists()
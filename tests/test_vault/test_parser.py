@@ -5,6 +5,7 @@ from pathlib import Path
 
 from vault.parser import (
     parse_frontmatter,
+    parse_frontmatter_only,
     parse_note,
     parse_tags,
     parse_wikilinks,
@@ -120,6 +121,39 @@ class TestParseTags:
         tags = parse_tags("Use `#include` in C code.")
         assert "include" not in tags
 
+    def test_tag_later_in_code_span_excluded(self):
+        assert parse_tags("Run `make #target` then #deploy, `#x`.") == ["deploy"]
+
+
+# ---------------------------------------------------------------------------
+# parse_frontmatter_only
+# ---------------------------------------------------------------------------
+
+
+class TestParseFrontmatterOnly:
+    def test_matches_full_parse(self, tmp_path: Path):
+        md = tmp_path / "note.md"
+        md.write_text("---\ntitle: Hi\ntags: [a]\n---\n" + "body\n" * 5000, encoding="utf-8")
+        assert parse_frontmatter_only(md) == {"title": "Hi", "tags": ["a"]}
+
+    def test_header_spanning_several_lines(self, tmp_path: Path):
+        md = tmp_path / "long.md"
+        md.write_text("---\nsummary: " + "x" * 20000 + "\n---\nBody.\n", encoding="utf-8")
+        assert parse_frontmatter_only(md) == {"summary": "x" * 20000}
+
+    def test_crlf_and_missing_frontmatter(self, tmp_path: Path):
+        crlf = tmp_path / "crlf.md"
+        crlf.write_bytes(b"---\r\ntitle: Win\r\n---\r\nBody.\r\n")
+        plain = tmp_path / "plain.md"
+        plain.write_text("# Just a heading\n", encoding="utf-8")
+        assert parse_frontmatter_only(crlf) == {"title": "Win"}
+        assert parse_frontmatter_only(plain) == {}
+
+    def test_unclosed_fence(self, tmp_path: Path):
+        md = tmp_path / "open.md"
+        md.write_text("---\n" + "key: value\n" * 10000, encoding="utf-8")
+        assert parse_frontmatter_only(md) == {}
+
 
 # ---------------------------------------------------------------------------
 # parse_note (integration)
@@ -166,3 +200,29 @@ class TestParseNote:
         )
         note = parse_note(md)
         assert note.tags.count("python") == 1
+
+    def test_rendered_body_and_tags_md(self, tmp_path: Path):
+        md = tmp_path / "render.md"
+        md.write_text("---\ntags: [a, b]\n---\nSee [[other]].\n", encoding="utf-8")
+        note = parse_note(md)
+        assert note.body_rendered == "See **other**.\n"
+        assert note.tags_md == "`#a` `#b`"
+
+    def test_links_and_tags_from_one_scan(self, tmp_path: Path):
+        md = tmp_path / "scan.md"
+        md.write_text("#a [[x|alias #b]] [[y#heading]] #a #c\n", encoding="utf-8")
+        note = parse_note(md)
+        assert note.links == ["x", "y"]
+        assert note.tags == ["a", "c"]
+
+    def test_unpickled_note_reinterns_identifiers(self, tmp_path: Path):
+        import pickle
+
+        md = tmp_path / "pickled.md"
+        md.write_text("#tag [[target]]\n", encoding="utf-8")
+        note = parse_note(md)
+        clone = pickle.loads(pickle.dumps((note.slug, note)))[1]
+        assert clone == note
+        assert clone.slug is note.slug
+        assert clone.tags[0] is note.tags[0]
+        assert clone.links[0] is note.links[0]
@@ -5,7 +5,12 @@ from pathlib import Path
 
 import pytest
 
-from vault.plugin import PluginDescriptor, fire_hook, load_all_plugins, load_plugin
+from vault.plugin import (
+    PluginDescriptor,
+    fire_hook,
+    load_all_plugins,
+    load_plugin,
+)
 
 # ---------------------------------------------------------------------------
 # PluginDescriptor.from_dict
@@ -85,6 +90,32 @@ class TestLoadPlugin:
         plugin = load_plugin(graph_toml)
         assert hasattr(plugin, "on_load")
 
+    def test_unchanged_descriptor_not_reparsed(self, graph_toml: Path, monkeypatch):
+        first = load_plugin(graph_toml)
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("descriptor re-parsed")
+
+        monkeypatch.setattr("vault.plugin.tomllib.loads", fail)
+        second = load_plugin(graph_toml)
+        assert second is not first
+        assert second.descriptor == first.descriptor
+
+    def test_cached_descriptor_not_shared(self, graph_toml: Path):
+        first = load_plugin(graph_toml)
+        first.descriptor.hooks.append("on_custom")
+        second = load_plugin(graph_toml)
+        assert second.descriptor is not first.descriptor
+        assert "on_custom" not in second.descriptor.hooks
+
+    def test_edited_descriptor_reparsed(self, graph_toml: Path):
+        load_plugin(graph_toml)
+        graph_toml.write_text(
+            "[plugin]\nid='renamed'\nname='Renamed'\nentry='vault.graph'\n",
+            encoding="utf-8",
+        )
+        assert load_plugin(graph_toml).descriptor.id == "renamed"
+
     def test_missing_create_plugin_raises(self, tmp_path: Path):
         """A plugin module without create_plugin() should raise AttributeError."""
         # Write a module with no create_plugin
@@ -106,6 +137,15 @@ class TestLoadPlugin:
             sys.path.remove(str(tmp_path))
             sys.modules.pop("bad_plugin", None)
 
+    def test_missing_entry_module_raises(self, tmp_path: Path):
+        toml = tmp_path / "ghost.toml"
+        toml.write_text(
+            "[plugin]\nid='ghost'\nname='Ghost'\nentry='no_such_plugin_module'\n",
+            encoding="utf-8",
+        )
+        with pytest.raises(ModuleNotFoundError, match="no_such_plugin_module"):
+            load_plugin(toml)
+
 
 # ---------------------------------------------------------------------------
 # load_all_plugins
@@ -128,6 +168,17 @@ class TestLoadAllPlugins:
         ids = {p.descriptor.id for p in plugins}
         assert ids == {"graph-view", "canvas", "backlinks"}
 
+    def test_returned_in_file_name_order(self, tmp_path: Path):
+        for name in ("c", "a", "b", "d"):
+            (tmp_path / f"{name}.toml").write_text(
+                f"[plugin]\nid='{name}'\nname='{name}'\nentry='vault.graph'\n",
+                encoding="utf-8",
+            )
+        assert [p.descriptor.id for p in load_all_plugins(tmp_path)] == ["a", "b", "c", "d"]
+
+    def test_missing_directory_loads_nothing(self, tmp_path: Path):
+        assert load_all_plugins(tmp_path / "absent") == []
+
     def test_skips_bad_plugins(self, tmp_path: Path):
         """A broken plugin should not prevent others from loading."""
         good = tmp_path / "good.toml"
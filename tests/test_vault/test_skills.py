@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from vault.skills import SkillIndex, _parse_skill
+from vault.skills import SkillDescriptor, SkillIndex, _parse_skill
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -73,7 +73,16 @@ class TestSkillDescriptor:
 
     def test_body_contains_steps(self, skills_dir: Path):
         skill = _parse_skill(skills_dir / "create-note.md")
-        assert "## Steps" in skill.body
+        assert "## Steps" in skill.read_body()
+
+    def test_body_passed_to_constructor(self, tmp_path: Path):
+        skill = SkillDescriptor(tmp_path / "x.md", "x", "X", "", [], [], "Given body")
+        assert skill.read_body() == "Given body"
+
+    def test_equality_ignores_loaded_body(self, skills_dir: Path):
+        loaded = _parse_skill(skills_dir / "create-note.md")
+        loaded.read_body()
+        assert loaded == _parse_skill(skills_dir / "create-note.md")
 
     def test_to_dict_keys(self, skills_dir: Path):
         skill = _parse_skill(skills_dir / "add-todo.md")
@@ -134,6 +143,15 @@ class TestSkillIndex:
         results = idx.search("tk")
         assert any(s.slug == "add-todo" for s in results)
 
+    def test_search_trigrams_from_different_fields_do_not_match(self, tmp_path: Path):
+        (tmp_path / "s.md").write_text(
+            "---\nskill: s\nname: Xabc\ndescription: bcdY\n---\nBody.\n", encoding="utf-8"
+        )
+        idx = SkillIndex(tmp_path)
+        idx.build()
+        assert idx.search("abcd") == []
+        assert [s.slug for s in idx.search("XABC")] == ["s"]
+
     def test_by_trigger_exact(self, skills_dir: Path):
         idx = SkillIndex(skills_dir)
         idx.build()
@@ -146,6 +164,16 @@ class TestSkillIndex:
         idx.build()
         assert idx.by_trigger("TK") == idx.by_trigger("tk")
 
+    def test_by_trigger_shared_between_skills(self, tmp_path: Path):
+        for slug in ("one", "two"):
+            (tmp_path / f"{slug}.md").write_text(
+                f"---\nskill: {slug}\nname: {slug}\ntriggers: [Go, go]\n---\nBody.\n",
+                encoding="utf-8",
+            )
+        idx = SkillIndex(tmp_path)
+        idx.build()
+        assert [s.slug for s in idx.by_trigger("GO")] == ["one", "two"]
+
     def test_resolve_shorthand_exact_trigger(self, skills_dir: Path):
         idx = SkillIndex(skills_dir)
         idx.build()
@@ -158,6 +186,14 @@ class TestSkillIndex:
         results = idx.resolve_shorthand("todo")
         assert len(results) >= 1
 
+    def test_resolve_shorthand_cache_cleared_by_build(self, skills_dir: Path):
+        idx = SkillIndex(skills_dir)
+        idx.build()
+        assert idx.resolve_shorthand("cn") == idx.resolve_shorthand(" CN ")
+        (skills_dir / "create-note.md").unlink()
+        idx.build()
+        assert all(s.slug != "create-note" for s in idx.resolve_shorthand("cn"))
+
     def test_bad_skill_skipped(self, tmp_path: Path):
         """A skill file that fails to parse should not prevent others from loading."""
         (tmp_path / "good.md").write_text(
@@ -168,3 +204,17 @@ class TestSkillIndex:
         idx = SkillIndex(tmp_path)
         idx.build()
         assert "good" in idx.skills
+
+    def test_parallel_build_matches_serial(
+        self, skills_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        import vault.skills as skills_module
+
+        (skills_dir / "broken.md").write_bytes(b"---\nname: \xff\n---\n")
+        serial = SkillIndex(skills_dir, parallel=False)
+        serial.build()
+        monkeypatch.setattr(skills_module, "_PARALLEL_THRESHOLD", 1)
+        parallel = SkillIndex(skills_dir)
+        parallel.build()
+        assert list(parallel.skills) == list(serial.skills) == ["add-todo", "create-note"]
+        assert parallel.skills == serial.skills
@@ -1,12 +1,13 @@
 """Unit tests for vault.todos."""
 
+import sys
 import textwrap
 from pathlib import Path
 
 import pytest
 
 from vault.index import VaultIndex
-from vault.todos import TodoItem, append_todo, resolve_todo, scan_todos
+from vault.todos import TodoIndex, TodoItem, append_todo, resolve_todo, scan_todos
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -77,6 +78,19 @@ class TestScanTodos:
         assert all("inside a code block" not in d for d in descs)
         assert any("outside the fence" in d for d in descs)
 
+    def test_ignores_tk_in_html_comment(self, tmp_path: Path):
+        _write_note(tmp_path, "delta", """\
+            <!-- TK: hidden inline -->
+            <!--
+            TK: hidden in block
+            -->
+            TK: visible
+        """)
+        idx = VaultIndex(tmp_path)
+        idx.build()
+        todos = scan_todos(idx).items
+        assert [(t.line_no, t.description) for t in todos] == [(5, "visible")]
+
     def test_clean_note_has_no_todos(self, vault_with_todos: VaultIndex):
         todo_idx = scan_todos(vault_with_todos)
         beta_todos = [t for t in todo_idx.items if t.source_slug == "beta"]
@@ -87,10 +101,25 @@ class TestScanTodos:
         alpha_todos = [t for t in todo_idx.items if t.source_slug == "alpha"]
         assert all(t.line_no >= 1 for t in alpha_todos)
 
-    def test_empty_vault(self, tmp_path: Path):
-        idx = VaultIndex(tmp_path)
-        idx.build()
-        todo_idx = scan_todos(idx)
+    def test_incremental_rescan_reuses_unchanged_notes(self, vault_with_todos: VaultIndex):
+        first = scan_todos(vault_with_todos)
+        _write_note(vault_with_todos.vault_dir, "beta", "TK: new item\n")
+        vault_with_todos.build()
+        second = scan_todos(vault_with_todos, previous=first)
+        assert second.by_note["alpha"][0] is first.by_note["alpha"][0]
+        assert [t.description for t in second.by_note["beta"]] == ["new item"]
+
+    def test_parallel_scan_matches_serial(
+        self, vault_with_todos: VaultIndex, monkeypatch: pytest.MonkeyPatch
+    ):
+        import vault.todos as todos_module
+
+        serial = scan_todos(vault_with_todos, parallel=False)
+        monkeypatch.setattr(todos_module, "_PARALLEL_THRESHOLD", 1)
+        assert scan_todos(vault_with_todos).items == serial.items
+
+    def test_empty_vault(self, empty_index: VaultIndex):
+        todo_idx = scan_todos(empty_index)
         assert todo_idx.items == []
 
 
@@ -111,6 +140,30 @@ class TestTodoIndex:
         assert "alpha" in by_note
         assert all(t.source_slug == "alpha" for t in by_note["alpha"])
 
+    def test_append_item_updates_by_note(self, vault_with_todos: VaultIndex):
+        todo_idx = scan_todos(vault_with_todos)
+        before = len(todo_idx.by_note["alpha"])
+        todo_idx.append_item(TodoItem("alpha", 99, "late", "TK: late"))
+        assert len(todo_idx.by_note["alpha"]) == before + 1
+        # The incremental-scan cache is unaffected
+        assert len(scan_todos(vault_with_todos, todo_idx).by_note["alpha"]) == before
+
+    def test_direct_append_regroups_by_note(self, vault_with_todos: VaultIndex):
+        todo_idx = scan_todos(vault_with_todos)
+        before = len(todo_idx.by_note["alpha"])
+        todo_idx.items.append(TodoItem("alpha", 99, "late", "TK: late"))
+        assert len(todo_idx.by_note["alpha"]) == before + 1
+        todo_idx.items = [TodoItem("beta", 1, "x", "TK: x")]
+        assert list(todo_idx.by_note) == ["beta"]
+
+    def test_source_slug_is_interned(self):
+        slug = "".join(["al", "pha"])
+        assert TodoItem(slug, 1, "x", "TK: x").source_slug is sys.intern("alpha")
+
+    def test_constructed_with_items(self):
+        item = TodoItem("alpha", 1, "x", "TK: x")
+        assert TodoIndex([item]).by_note == {"alpha": [item]}
+
     def test_to_dict(self):
         item = TodoItem("alpha", 3, "do something", "  TK: do something")
         d = item.to_dict()
@@ -175,3 +228,16 @@ class TestResolveTodo:
     def test_nonexistent_note_is_noop(self, tmp_path: Path):
         item = TodoItem("ghost", 1, "task", "- [ ] TK: task")
         resolve_todo(tmp_path, item)  # must not raise
+
+    def test_only_target_line_changes(self, tmp_path: Path):
+        note = tmp_path / "alpha.md"
+        note.write_bytes(b"- [ ] TK: one\r\n- []  TK: two\r\n- [ ] TK: three\r\n")
+        resolve_todo(tmp_path, TodoItem("alpha", 2, "two", "- []  TK: two"))
+        resolve_todo(tmp_path, TodoItem("alpha", 3, "three", "- [ ] TK: three"))
+        assert note.read_bytes() == b"- [ ] TK: one\r\n- [x]  TK: two\r\n- [x] TK: three\r\n"
+
+    def test_line_past_end_is_noop(self, tmp_path: Path):
+        (tmp_path / "alpha.md").write_text("- [ ] TK: one\n", encoding="utf-8")
+        item = TodoItem("alpha", 5, "gone", "- [ ] TK: gone")
+        resolve_todo(tmp_path, item)
+        assert item.resolved is False